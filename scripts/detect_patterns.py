@@ -19,6 +19,8 @@ import argparse
 import json
 import re
 import sys
+from collections import Counter
+from functools import lru_cache
 
 # Known cross-cutting categories (from cross-cutting-catalog.md)
 ALWAYS_EVALUATE = [
@@ -54,6 +56,21 @@ CATEGORY_KEYWORDS = {
     "distributed_tracing": ["trace", "tracing", "span", "otel", "jaeger", "zipkin"],
 }
 
+# (priority, ((category, keywords), ...)) in classification order; a
+# category without keyword entries matches on its own name
+_CATEGORY_TIERS = tuple(
+    (priority, tuple(
+        (category, tuple(CATEGORY_KEYWORDS.get(category, [category])))
+        for category in categories
+    ))
+    for priority, categories in (
+        ("always", ALWAYS_EVALUATE),
+        ("multi_service", IF_MULTI_SERVICE),
+        ("user_facing", IF_USER_FACING),
+        ("data_heavy", IF_DATA_HEAVY),
+    )
+)
+
 
 def calculate_fan_in(modules: list[dict]) -> list[dict]:
     """Count how many modules import each dependency.
@@ -66,31 +83,31 @@ def calculate_fan_in(modules: list[dict]) -> list[dict]:
     Returns:
         List of fan-in patterns detected.
     """
-    import_counts: dict[str, int] = {}
     total_modules = len(modules)
 
     if total_modules == 0:
         return []
 
-    for module in modules:
-        seen = set()
-        for imp in module.get("imports", []):
-            imp_lower = imp.lower()
-            if imp_lower not in seen:
-                import_counts[imp_lower] = import_counts.get(imp_lower, 0) + 1
-                seen.add(imp_lower)
+    # Each module counts once per import; dict.fromkeys dedupes in order
+    import_counts = Counter(
+        imp
+        for module in modules
+        for imp in dict.fromkeys(i.lower() for i in module.get("imports", []))
+    )
 
     patterns = []
-    for imp, count in sorted(import_counts.items(), key=lambda x: -x[1]):
+    # most_common() is sorted by count, so stop at the first low score
+    for imp, count in import_counts.most_common():
         fan_in_score = count / total_modules
-        if fan_in_score > 0.5:
-            patterns.append({
-                "type": "fan_in",
-                "name": imp,
-                "fan_in_score": round(fan_in_score, 2),
-                "evidence": f"Imported in {count}/{total_modules} modules ({fan_in_score:.0%})",
-                "module_count": count,
-            })
+        if fan_in_score <= 0.5:
+            break
+        patterns.append({
+            "type": "fan_in",
+            "name": imp,
+            "fan_in_score": round(fan_in_score, 2),
+            "evidence": f"Imported in {count}/{total_modules} modules ({fan_in_score:.0%})",
+            "module_count": count,
+        })
 
     return patterns
 
@@ -176,48 +193,34 @@ def classify_as_cross_cutting(
     """Check if a detected pattern matches a known cross-cutting category."""
     name_lower = pattern["name"].lower()
 
-    # Check always-evaluate categories
-    for category in ALWAYS_EVALUATE:
-        keywords = CATEGORY_KEYWORDS.get(category, [category])
-        if any(kw in name_lower for kw in keywords):
-            return {
-                "is_cross_cutting": True,
-                "category": category,
-                "priority": "always",
-            }
-
-    # Check conditional categories
-    if is_multi_service:
-        for category in IF_MULTI_SERVICE:
-            keywords = CATEGORY_KEYWORDS.get(category, [category])
+    # Categories match by keyword substring, so this stays a scan, but over
+    # tiers resolved once at import instead of per call
+    enabled = (True, is_multi_service, is_user_facing, is_data_heavy)
+    for (priority, categories), on in zip(_CATEGORY_TIERS, enabled):
+        if not on:
+            continue
+        for category, keywords in categories:
             if any(kw in name_lower for kw in keywords):
                 return {
                     "is_cross_cutting": True,
                     "category": category,
-                    "priority": "multi_service",
+                    "priority": priority,
                 }
 
-    if is_user_facing:
-        for category in IF_USER_FACING:
-            keywords = CATEGORY_KEYWORDS.get(category, [category])
-            if any(kw in name_lower for kw in keywords):
-                return {
-                    "is_cross_cutting": True,
-                    "category": category,
-                    "priority": "user_facing",
-                }
+    return None
 
-    if is_data_heavy:
-        for category in IF_DATA_HEAVY:
-            keywords = CATEGORY_KEYWORDS.get(category, [category])
-            if any(kw in name_lower for kw in keywords):
-                return {
-                    "is_cross_cutting": True,
-                    "category": category,
-                    "priority": "data_heavy",
-                }
 
-    return None
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=1024)
+def _word_set(text: str) -> frozenset[str]:
+    """Lowercased word set of text, cached across is_already_tracked calls.
+
+    Every detected pattern is compared against the same existing
+    constraints, so each constraint is tokenized only once.
+    """
+    return frozenset(_WORD_RE.findall(text.lower()))
 
 
 def is_already_tracked(
@@ -227,12 +230,12 @@ def is_already_tracked(
 
     Uses word-overlap (Jaccard > 0.5) for semantic deduplication.
     """
-    pattern_words = set(re.findall(r"\w+", pattern_name.lower()))
+    pattern_words = _word_set(pattern_name)
     if not pattern_words:
         return False
 
     for constraint in existing_constraints:
-        constraint_words = set(re.findall(r"\w+", constraint.lower()))
+        constraint_words = _word_set(constraint)
         if not constraint_words:
             continue
         overlap = len(pattern_words & constraint_words)
@@ -323,7 +326,7 @@ def detect_patterns(input_data: dict) -> dict:
     }
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Detect emerging patterns in codebase analysis"
     )
@@ -332,7 +335,7 @@ def main():
         help="Path to codebase analysis JSON file (alternative to stdin)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.analysis_file:
         with open(args.analysis_file) as f:
@@ -32,6 +32,15 @@ TOKEN_BUDGET = {
 }
 TOTAL_CHAR_BUDGET = sum(TOKEN_BUDGET.values())
 
+# Words too generic to say anything about a feature's scope
+STOP_WORDS = frozenset({
+    "a", "an", "the", "add", "create", "make", "build", "implement",
+    "new", "with", "for", "and", "or", "to", "in", "on", "of",
+    "is", "it", "this", "that", "be", "as", "at", "by", "from",
+    "support", "feature", "system", "should", "will", "can",
+})
+_KEYWORD_RE = re.compile(r"[a-zA-Z]+")
+
 
 def load_text(path: Path) -> str | None:
     """Load a text file, return None if not found."""
@@ -116,13 +125,13 @@ def extract_track_summaries(
         brief_path = meta_path.parent / "brief.md"
         brief_text = load_text(brief_path)
 
-        # Compute relevance score based on keyword overlap
+        # Compute relevance score based on keyword overlap; the text is
+        # assembled first and lowercased in one pass
         track_text = (
             f"{track_id} {meta.get('description', '')} "
             f"{' '.join(meta.get('dependencies', []))}"
+            + (f" {brief_text[:500]}" if brief_text else "")
         ).lower()
-        if brief_text:
-            track_text += f" {brief_text[:500].lower()}"
 
         relevance = sum(
             1 for kw in feature_keywords if kw in track_text
@@ -264,17 +273,11 @@ def extract_codebase_hints(
 
 def extract_keywords(description: str) -> list[str]:
     """Extract meaningful keywords from a feature description."""
-    stop_words = {
-        "a", "an", "the", "add", "create", "make", "build", "implement",
-        "new", "with", "for", "and", "or", "to", "in", "on", "of",
-        "is", "it", "this", "that", "be", "as", "at", "by", "from",
-        "support", "feature", "system", "should", "will", "can",
-    }
-    words = re.findall(r"[a-zA-Z]+", description.lower())
-    return [w for w in words if w not in stop_words and len(w) > 2]
+    words = _KEYWORD_RE.findall(description.lower())
+    return [w for w in words if w not in STOP_WORDS and len(w) > 2]
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Prepare context bundle for feature decomposition"
     )
@@ -291,7 +294,7 @@ def main():
         help="Path to architect directory",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     conductor_dir = Path(args.conductor_dir)
     architect_dir = Path(args.architect_dir)
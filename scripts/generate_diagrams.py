@@ -32,6 +32,11 @@ STATUS_CLASSES = {
     "needs_patch": "blocked",
 }
 
+GANTT_STATUSES = {
+    "completed": "done",
+    "in_progress": "active",
+}
+
 MERMAID_CLASS_DEFS = """\
     classDef complete fill:#28a745,color:#fff,stroke:#1e7e34
     classDef in_progress fill:#007bff,color:#fff,stroke:#0056b3
@@ -39,6 +44,14 @@ MERMAID_CLASS_DEFS = """\
     classDef blocked fill:#dc3545,color:#fff,stroke:#bd2130
 """
 
+# --- Markdown patterns (compiled once; the parsers run them per line) ---
+
+_WAVE_HEADING_RE = re.compile(r"^##\s+Wave\s+(\d+)")
+_COMPONENT_SECTION_RE = re.compile(r"^##\s+Component", re.IGNORECASE)
+_H2_RE = re.compile(r"^##\s+")
+_H3_RE = re.compile(r"^###\s+(.+)")
+_UNSAFE_ID_CHARS_RE = re.compile(r"[^a-zA-Z0-9_]")
+
 
 def load_all_metadata(tracks_dir: str) -> dict[str, dict]:
     """Load all track metadata keyed by track_id."""
@@ -68,7 +81,7 @@ def parse_dependency_graph(architect_dir: str) -> dict[str, list[str]]:
     graph: dict[str, list[str]] = {}
 
     for line in text.splitlines():
-        if not line.startswith("|") or line.startswith("| Track") or line.startswith("|---"):
+        if not line.startswith("|") or line.startswith(("| Track", "|---")):
             continue
         cols = [c.strip() for c in line.split("|")]
         if len(cols) >= 3:
@@ -77,7 +90,7 @@ def parse_dependency_graph(architect_dir: str) -> dict[str, list[str]]:
             if track and track != "-":
                 deps = []
                 if deps_str and deps_str != "-":
-                    deps = [d.strip() for d in deps_str.split(",") if d.strip() and d.strip() != "-"]
+                    deps = [d for d in map(str.strip, deps_str.split(",")) if d and d != "-"]
                 graph[track] = deps
 
     return graph
@@ -94,7 +107,8 @@ def parse_execution_sequence(architect_dir: str) -> list[dict]:
     current_wave = None
 
     for line in text.splitlines():
-        wave_match = re.match(r"^##\s+Wave\s+(\d+)", line)
+        # Only "##" lines can be wave headings; skip the regex for the rest
+        wave_match = line.startswith("##") and _WAVE_HEADING_RE.match(line)
         if wave_match:
             if current_wave:
                 waves.append(current_wave)
@@ -104,7 +118,7 @@ def parse_execution_sequence(architect_dir: str) -> list[dict]:
             }
             continue
 
-        if current_wave and line.startswith("|") and not line.startswith("| Track") and not line.startswith("|---"):
+        if current_wave and line.startswith("|") and not line.startswith(("| Track", "|---")):
             cols = [c.strip() for c in line.split("|")]
             if len(cols) >= 2 and cols[1] and cols[1] != "-":
                 current_wave["tracks"].append(cols[1].strip())
@@ -126,16 +140,16 @@ def parse_architecture_components(architect_dir: str) -> list[dict]:
     in_component_section = False
 
     for line in text.splitlines():
-        if re.match(r"^##\s+Component", line, re.IGNORECASE):
+        if _COMPONENT_SECTION_RE.match(line):
             in_component_section = True
             continue
-        if in_component_section and re.match(r"^##\s+", line) and not re.match(r"^###", line):
+        if in_component_section and _H2_RE.match(line) and not line.startswith("###"):
             in_component_section = False
             continue
 
         if in_component_section:
             # Match table rows
-            if line.startswith("|") and not line.startswith("| Component") and not line.startswith("|---"):
+            if line.startswith("|") and not line.startswith(("| Component", "|---")):
                 cols = [c.strip() for c in line.split("|")]
                 if len(cols) >= 4 and cols[1]:
                     components.append({
@@ -145,7 +159,7 @@ def parse_architecture_components(architect_dir: str) -> list[dict]:
                     })
 
             # Match ### headings
-            comp_match = re.match(r"^###\s+(.+)", line)
+            comp_match = _H3_RE.match(line)
             if comp_match:
                 name = comp_match.group(1).strip()
                 components.append({
@@ -159,7 +173,7 @@ def parse_architecture_components(architect_dir: str) -> list[dict]:
 
 def sanitize_id(track_id: str) -> str:
     """Make a track ID safe for Mermaid node names."""
-    return re.sub(r"[^a-zA-Z0-9_]", "_", track_id)
+    return _UNSAFE_ID_CHARS_RE.sub("_", track_id)
 
 
 # --- Diagram generators ---
@@ -235,16 +249,9 @@ def generate_wave_timeline(
         lines.append(f"    section Wave {wave['number']}")
         for track_id in wave["tracks"]:
             meta = metadata.get(track_id, {})
-            status = meta.get("status", "new")
+            gantt_status = GANTT_STATUSES.get(meta.get("status", "new"), "")
             wave_num = wave["number"]
 
-            if status == "completed":
-                gantt_status = "done"
-            elif status == "in_progress":
-                gantt_status = "active"
-            else:
-                gantt_status = ""
-
             marker = f"{gantt_status}, " if gantt_status else ""
             lines.append(
                 f"    {track_id} :{marker}{wave_num}, {wave_num + 1}"
@@ -265,13 +272,14 @@ def generate_diagrams(
 
     output_path = Path(output_dir)
     results = {"diagrams_generated": [], "warnings": []}
+    if not dry_run and (graph or components or waves):
+        output_path.mkdir(parents=True, exist_ok=True)
 
     # 1. Dependency graph
     if graph:
         mmd = generate_dependency_graph(graph, metadata)
         if not dry_run:
-            output_path.mkdir(parents=True, exist_ok=True)
-            (output_path / "dependency-graph.mmd").write_text(mmd)
+            (output_path / "dependency-graph.mmd").write_bytes(mmd.encode())
         results["diagrams_generated"].append({
             "file": str(output_path / "dependency-graph.mmd"),
             "type": "dependency_graph",
@@ -285,8 +293,7 @@ def generate_diagrams(
     if components:
         mmd = generate_component_map(components)
         if not dry_run:
-            output_path.mkdir(parents=True, exist_ok=True)
-            (output_path / "component-map.mmd").write_text(mmd)
+            (output_path / "component-map.mmd").write_bytes(mmd.encode())
         results["diagrams_generated"].append({
             "file": str(output_path / "component-map.mmd"),
             "type": "component_map",
@@ -299,8 +306,7 @@ def generate_diagrams(
     if waves:
         mmd = generate_wave_timeline(waves, metadata)
         if not dry_run:
-            output_path.mkdir(parents=True, exist_ok=True)
-            (output_path / "wave-timeline.mmd").write_text(mmd)
+            (output_path / "wave-timeline.mmd").write_bytes(mmd.encode())
         results["diagrams_generated"].append({
             "file": str(output_path / "wave-timeline.mmd"),
             "type": "wave_timeline",
@@ -312,7 +318,7 @@ def generate_diagrams(
     return results
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Generate Mermaid diagrams from Architect artifacts"
     )
@@ -325,7 +331,7 @@ def main():
     parser.add_argument("--dry-run", action="store_true",
                         help="Generate content without writing files")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     result = generate_diagrams(
         args.tracks_dir, args.architect_dir, args.output_dir, args.dry_run
     )
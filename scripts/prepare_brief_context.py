@@ -29,8 +29,15 @@ import argparse
 import json
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# cross-cutting.md patterns, compiled once rather than per line
+_CONCERN_MARKER_RE = re.compile(r"\s*\((NEW|MODIFIED)\)\s*$")
+_TRACK_REF_RE = re.compile(r"\b(\d{2}_\w+)\b")
+_TRACK_NUMS_RE = re.compile(r"Tracks?\s+([\d,\s]+)")
+_TWO_DIGITS_RE = re.compile(r"\d{2}")
+
 
 def load_json(path: Path) -> dict | None:
     """Load a JSON file, return None if not found."""
@@ -90,6 +97,9 @@ def extract_constraints_for_track(cc_text: str, track_id: str) -> list[str]:
     current_concern = None
     description_lines = []
     applies_to_track = True
+    # A "Tracks 04, 05" scope names this track when it lists the track's
+    # two-digit prefix ("04_api" -> "04", or a bare "04" id)
+    track_num = track_id[:2] if len(track_id) == 2 or track_id[2:3] == "_" else None
 
     for line in cc_text.splitlines():
         # Match ### headings (concern names)
@@ -101,7 +111,7 @@ def extract_constraints_for_track(cc_text: str, track_id: str) -> list[str]:
 
             current_concern = line[4:].strip()
             # Remove (NEW) or (MODIFIED) markers
-            current_concern = re.sub(r"\s*\((NEW|MODIFIED)\)\s*$", "", current_concern)
+            current_concern = _CONCERN_MARKER_RE.sub("", current_concern)
             description_lines = []
             applies_to_track = True
 
@@ -109,17 +119,13 @@ def extract_constraints_for_track(cc_text: str, track_id: str) -> list[str]:
             scope = line.split(":", 1)[1].strip()
             # Extract track IDs mentioned in scope (e.g., "Tracks 04, 05, 06"
             # or track_id patterns like "03_auth")
-            track_refs = re.findall(r"\b(\d{2}_\w+)\b", scope)
-            paren_track_nums = re.findall(r"Tracks?\s+([\d,\s]+)", scope)
+            paren_track_nums = _TRACK_NUMS_RE.search(scope)
             if paren_track_nums:
                 # Extract 2-digit numbers from "Tracks 04, 05, 06"
-                nums = re.findall(r"\d{2}", paren_track_nums[0])
+                nums = _TWO_DIGITS_RE.findall(paren_track_nums.group(1))
                 # Match if our track starts with any of these numbers
-                applies_to_track = any(
-                    track_id.startswith(n + "_") or track_id == n
-                    for n in nums
-                )
-            elif track_refs:
+                applies_to_track = track_num in nums
+            elif track_refs := _TRACK_REF_RE.findall(scope):
                 # Explicit track IDs mentioned (e.g., "03_auth")
                 applies_to_track = track_id in track_refs
             else:
@@ -147,60 +153,66 @@ def extract_architecture_excerpt(arch_text: str, track_id: str, track_name: str)
     if not arch_text:
         return ""
 
-    lines = arch_text.splitlines()
-    excerpt_lines = []
-    capturing = False
-    capture_level = 0
+    lines, headings = _split_headings(arch_text)
 
     # Try to find a section mentioning this track
     track_name_lower = track_name.lower() if track_name else ""
-    track_id_clean = track_id.replace("_", " ").lower()
-
-    for i, line in enumerate(lines):
-        if line.startswith("#"):
-            heading_level = len(line) - len(line.lstrip("#"))
-            heading_text = line.lstrip("#").strip().lower()
+    track_id_lower = track_id.lower()
+    id_words = [
+        word for word in track_id.replace("_", " ").lower().split()
+        if len(word) > 3
+    ]
+
+    # The excerpt runs from the first matching heading up to the next heading
+    # at or above the level of the most recent match
+    start = None
+    end = len(lines)
+    capture_level = 0
+    for i, heading_level, heading_text in headings:
+        if start is not None and heading_level <= capture_level:
+            end = i
+            break
+
+        # Check if heading matches track
+        if (
+            track_id_lower in heading_text
+            or (track_name_lower and track_name_lower in heading_text)
+            or any(word in heading_text for word in id_words)
+        ):
+            if start is None:
+                start = i
+            capture_level = heading_level
+
+    if start is not None:
+        return "\n".join(lines[start:end]).strip()
 
-            if capturing:
-                # Stop if we hit a heading at same or higher level
-                if heading_level <= capture_level:
+    # Fallback: try to find "Component Map" section
+    for n, (i, section_level, heading_text) in enumerate(headings):
+        if "component" in heading_text:
+            end = len(lines)
+            for j, next_level, _ in headings[n + 1:]:
+                if next_level <= section_level:
+                    end = j
                     break
+            return "\n".join(lines[i:end]).strip()
 
-            # Check if heading matches track
-            if (
-                track_id.lower() in heading_text
-                or (track_name_lower and track_name_lower in heading_text)
-                or any(
-                    word in heading_text
-                    for word in track_id_clean.split()
-                    if len(word) > 3
-                )
-            ):
-                capturing = True
-                capture_level = heading_level
-                excerpt_lines.append(line)
-                continue
-
-        if capturing:
-            excerpt_lines.append(line)
-
-    if excerpt_lines:
-        return "\n".join(excerpt_lines).strip()
+    return ""
 
-    # Fallback: try to find "Component Map" section
-    for i, line in enumerate(lines):
-        if line.startswith("#") and "component" in line.lower():
-            section_level = len(line) - len(line.lstrip("#"))
-            section_lines = [line]
-            for j in range(i + 1, len(lines)):
-                if lines[j].startswith("#"):
-                    next_level = len(lines[j]) - len(lines[j].lstrip("#"))
-                    if next_level <= section_level:
-                        break
-                section_lines.append(lines[j])
-            return "\n".join(section_lines).strip()
 
-    return ""
+@lru_cache(maxsize=16)
+def _split_headings(text: str) -> tuple[tuple[str, ...], tuple[tuple[int, int, str], ...]]:
+    """Split markdown into its lines and headings, cached per text.
+
+    Headings are (line index, level, lowercased text) tuples. Repeated
+    excerpt lookups against the same architecture.md reuse the split.
+    """
+    lines = tuple(text.splitlines())
+    headings = tuple(
+        (i, len(line) - len(line.lstrip("#")), line.lstrip("#").strip().lower())
+        for i, line in enumerate(lines)
+        if line.startswith("#")
+    )
+    return lines, headings
 
 
 def estimate_tokens(text: str) -> int:
@@ -208,7 +220,7 @@ def estimate_tokens(text: str) -> int:
     return len(text) // 4
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Prepare filtered context bundle for a brief-generator sub-agent"
     )
@@ -237,7 +249,7 @@ def main():
     parser.add_argument("--requirements", nargs="*", default=[], help="Per-track requirements from product.md")
     parser.add_argument("--product-md-path", default="conductor/product.md", help="Path to product.md for fallback access")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     tracks_dir = Path(args.tracks_dir)
     architect_dir = Path(args.architect_dir)
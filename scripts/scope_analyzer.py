@@ -20,6 +20,7 @@ import argparse
 import json
 import re
 import sys
+from functools import lru_cache
 
 # --- Boundary identification ---
 
@@ -51,6 +52,13 @@ BOUNDARY_SIGNALS = {
     ],
 }
 
+# One alternation per boundary: a search matches wherever any keyword
+# occurs as a substring, the same test as checking each keyword with `in`.
+_BOUNDARY_RES = {
+    boundary: re.compile("|".join(map(re.escape, signals)))
+    for boundary, signals in BOUNDARY_SIGNALS.items()
+}
+
 # --- Ambiguity detection ---
 
 VAGUE_TERMS = [
@@ -104,15 +112,17 @@ def identify_boundaries(
     (e.g., "PostgreSQL" in tech stack triggering data_model for
     every feature).
     """
-    text = description.lower()
-    crossed = []
+    return list(_boundaries_in(description))
 
-    for boundary, signals in BOUNDARY_SIGNALS.items():
-        score = sum(1 for s in signals if s in text)
-        if score >= 1:
-            crossed.append(boundary)
 
-    return crossed
+@lru_cache(maxsize=512)
+def _boundaries_in(description: str) -> tuple[str, ...]:
+    """Cached boundary scan; callers get a fresh list from identify_boundaries."""
+    text = description.lower()
+    return tuple(
+        boundary for boundary, pattern in _BOUNDARY_RES.items()
+        if pattern.search(text)
+    )
 
 
 def is_atomic(description: str, boundaries: list[str]) -> bool:
@@ -401,7 +411,7 @@ def compute_dependencies(
     return list(dict.fromkeys(deps))  # Deduplicate preserving order
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Analyze feature scope for track decomposition"
     )
@@ -414,7 +424,7 @@ def main():
         help="Path to feature context JSON file (from feature_context.py)",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.feature:
         # Simple mode: feature description only
@@ -24,6 +24,12 @@ REMAINING_CHAR = "\u2591"     # ░
 
 COMPLEXITY_WEIGHTS = {"S": 1, "M": 2, "L": 3, "XL": 4}
 
+# Every bar for 0..BAR_WIDTH filled cells, built once
+_BARS = tuple(
+    COMPLETE_CHAR * i + REMAINING_CHAR * (BAR_WIDTH - i)
+    for i in range(BAR_WIDTH + 1)
+)
+
 
 def complexity_weight(c: str) -> int:
     """Get numeric weight for complexity string."""
@@ -33,25 +39,39 @@ def complexity_weight(c: str) -> int:
 def render_bar(percentage: float) -> str:
     """Render a progress bar string."""
     filled = int(percentage * BAR_WIDTH)
+    if 0 <= filled <= BAR_WIDTH:
+        return _BARS[filled]
     return COMPLETE_CHAR * filled + REMAINING_CHAR * (BAR_WIDTH - filled)
 
 
-def render_wave_line(wave: dict) -> str:
-    """Render a single wave progress line."""
+def summarize_tracks(tracks: list[dict]) -> tuple[int, int, int]:
+    """Return (total_points, complete_points, complete_count) in one pass."""
+    total_points = complete_points = complete_count = 0
+    for t in tracks:
+        weight = complexity_weight(t.get("complexity", "S"))
+        total_points += weight
+        if t.get("status") == "completed":
+            complete_points += weight
+            complete_count += 1
+    return total_points, complete_points, complete_count
+
+
+def render_wave_line(
+    wave: dict, summary: tuple[int, int, int] | None = None
+) -> str:
+    """Render a single wave progress line.
+
+    summary is the wave's summarize_tracks() result, if already computed.
+    """
     tracks = wave.get("tracks", [])
     number = wave.get("number", "?")
 
-    total_points = sum(
-        complexity_weight(t.get("complexity", "S")) for t in tracks
-    )
-    complete_points = sum(
-        complexity_weight(t.get("complexity", "S"))
-        for t in tracks if t.get("status") == "completed"
-    )
+    if summary is None:
+        summary = summarize_tracks(tracks)
+    total_points, complete_points, complete_count = summary
 
     pct = complete_points / total_points if total_points > 0 else 0
     bar = render_bar(pct)
-    complete_count = sum(1 for t in tracks if t.get("status") == "completed")
     total_count = len(tracks)
 
     return (
@@ -60,14 +80,17 @@ def render_wave_line(wave: dict) -> str:
     )
 
 
-def render_overall_line(waves: list[dict]) -> str:
-    """Render the overall progress line."""
-    all_tracks = [t for w in waves for t in w.get("tracks", [])]
-    total = sum(complexity_weight(t.get("complexity", "S")) for t in all_tracks)
-    complete = sum(
-        complexity_weight(t.get("complexity", "S"))
-        for t in all_tracks if t.get("status") == "completed"
-    )
+def render_overall_line(
+    waves: list[dict], summaries: list[tuple[int, int, int]] | None = None
+) -> str:
+    """Render the overall progress line.
+
+    summaries holds each wave's summarize_tracks() result, if already computed.
+    """
+    if summaries is None:
+        summaries = [summarize_tracks(w.get("tracks", [])) for w in waves]
+    total = sum(s[0] for s in summaries)
+    complete = sum(s[1] for s in summaries)
     pct = complete / total if total > 0 else 0
     bar = render_bar(pct)
     return f"  Overall {bar}  {pct:>3.0%}  weighted"
@@ -115,15 +138,18 @@ def render_progress(data: dict) -> str:
     lines.append("\u251c" + "\u2500" * width + "\u2524")
     lines.append("\u2502" + "".ljust(width) + "\u2502")
 
-    # Per-wave bars
-    for wave in sorted(waves, key=lambda w: w.get("number", 0)):
-        wave_line = render_wave_line(wave)
+    # Per-wave bars; each wave's tracks are summarized once for both bars
+    summaries = [summarize_tracks(w.get("tracks", [])) for w in waves]
+    for wave, summary in sorted(
+        zip(waves, summaries, strict=True), key=lambda ws: ws[0].get("number", 0)
+    ):
+        wave_line = render_wave_line(wave, summary)
         lines.append("\u2502" + wave_line.ljust(width) + "\u2502")
 
     lines.append("\u2502" + "".ljust(width) + "\u2502")
 
     # Overall bar
-    overall = render_overall_line(waves)
+    overall = render_overall_line(waves, summaries)
     lines.append("\u2502" + overall.ljust(width) + "\u2502")
 
     lines.append("\u2502" + "".ljust(width) + "\u2502")
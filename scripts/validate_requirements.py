@@ -30,8 +30,13 @@ import math
 import re
 import sys
 from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
 from difflib import SequenceMatcher
+from functools import cache, partial
 from pathlib import Path
+from typing import NamedTuple
 
 # ---------------------------------------------------------------------------
 # Requirement extraction
@@ -65,8 +70,29 @@ REQUIREMENT_HEADINGS = [
     "specification", "expectation",
 ]
 
+# Prose phrases that mark a non-list line as a requirement
+STRONG_INDICATORS = [
+    "must ", "must not ", "shall ", "shall not ",
+    "required to ", "is required",
+]
+
+
+def _substring_alternation(phrases: list[str]) -> re.Pattern:
+    """Compile phrases into one regex that matches wherever any phrase occurs.
+
+    Equivalent to ``any(p in text for p in phrases)`` but scans the text once.
+    No word boundaries are added, so the substring semantics are preserved.
+    """
+    ordered = sorted(phrases, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, ordered)))
+
+
+_REQ_KEYWORD_RE = _substring_alternation(REQUIREMENT_KEYWORDS)
+_REQ_HEADING_RE = _substring_alternation(REQUIREMENT_HEADINGS)
+_STRONG_INDICATOR_RE = _substring_alternation(STRONG_INDICATORS)
+
 # Stopwords to ignore during matching (common English words that add noise)
-STOPWORDS = {
+STOPWORDS = frozenset({
     "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
     "of", "with", "by", "from", "as", "is", "was", "are", "were", "be",
     "been", "being", "have", "has", "had", "do", "does", "did", "will",
@@ -75,6 +101,22 @@ STOPWORDS = {
     "not", "no", "if", "then", "else", "when", "where", "how", "all",
     "each", "every", "both", "few", "more", "most", "other", "some",
     "such", "than", "too", "very", "also", "any",
+})
+
+# Precompiled patterns for the matching hot path (called M*N times per run)
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_NUM_RE = re.compile(
+    r"(\d+(?:\.\d+)?)\s*(%|ms|s|sec|min|minutes?|hours?|hr|days?|gb|mb|kb|tb|k\b)?"
+)
+_WS_RE = re.compile(r"\s+")
+_DIGIT_RE = re.compile(r"\d")
+
+# Unit spellings normalized to a single canonical form by extract_numbers
+_UNIT_MAP = {
+    "min": "min", "minutes": "min", "minute": "min",
+    "sec": "s", "s": "s", "seconds": "s", "second": "s",
+    "hr": "hr", "hours": "hr", "hour": "hr",
+    "days": "day", "day": "day",
 }
 
 
@@ -92,66 +134,63 @@ def extract_requirements_from_product_md(product_md_path: str) -> list[str]:
         print(f"Error: product.md not found: {path}", file=sys.stderr)
         sys.exit(1)
 
-    text = path.read_text()
-    lines = text.splitlines()
     requirements: list[str] = []
+    seen: set[str] = set()
     in_requirement_section = False
     in_html_comment = False
 
-    for line in lines:
-        stripped = line.strip()
-
-        # Track HTML comment blocks
-        if "<!--" in stripped:
-            in_html_comment = True
-        if "-->" in stripped:
-            in_html_comment = False
-            continue
-        if in_html_comment:
-            continue
+    with open(path) as f:
+        for line in f:
+            stripped = line.strip()
+
+            # Track HTML comment blocks
+            if "<!--" in stripped:
+                in_html_comment = True
+            if "-->" in stripped:
+                in_html_comment = False
+                continue
+            if in_html_comment:
+                continue
 
-        # Track section headings
-        if stripped.startswith("#"):
-            heading_text = stripped.lstrip("#").strip().lower()
-            in_requirement_section = any(
-                kw in heading_text for kw in REQUIREMENT_HEADINGS
-            )
-            continue
+            # Track section headings
+            if stripped.startswith("#"):
+                heading_text = stripped.lstrip("#").strip().lower()
+                in_requirement_section = _REQ_HEADING_RE.search(heading_text) is not None
+                continue
 
-        # Skip empty lines
-        if not stripped:
-            continue
+            # Skip empty lines
+            if not stripped:
+                continue
 
-        is_list_item = stripped.startswith("- ") or stripped.startswith("* ")
-        content = stripped[2:] if is_list_item else stripped
-        content_lower = content.lower()
+            is_list_item = stripped.startswith(("- ", "* "))
+            content = stripped[2:] if is_list_item else stripped
+            content_lower = content.lower()
 
-        is_requirement = False
+            is_requirement = False
 
-        # Heuristic 1: Lines containing specific numbers/quantities
-        if re.search(r"\d+", stripped) and (is_list_item or in_requirement_section):
-            is_requirement = True
+            # Heuristic 1: Lines containing specific numbers/quantities
+            if _DIGIT_RE.search(stripped) and (is_list_item or in_requirement_section):
+                is_requirement = True
 
-        # Heuristic 2: List items with requirement keywords
-        if is_list_item and any(kw in content_lower for kw in REQUIREMENT_KEYWORDS):
-            is_requirement = True
+            # Heuristic 2: List items with requirement keywords
+            if is_list_item and _REQ_KEYWORD_RE.search(content_lower):
+                is_requirement = True
 
-        # Heuristic 3: All list items in requirement sections
-        if in_requirement_section and is_list_item:
-            is_requirement = True
+            # Heuristic 3: All list items in requirement sections
+            if in_requirement_section and is_list_item:
+                is_requirement = True
 
-        # Heuristic 4: Prose with strong requirement indicators
-        # Catches requirements not formatted as list items
-        if not is_list_item and not stripped.startswith("#"):
-            strong_indicators = ["must ", "must not ", "shall ", "shall not ",
-                                 "required to ", "is required"]
-            if any(ind in content_lower for ind in strong_indicators):
+            # Heuristic 4: Prose with strong requirement indicators
+            # Catches requirements not formatted as list items
+            if (not is_list_item and not stripped.startswith("#")
+                    and _STRONG_INDICATOR_RE.search(content_lower)):
                 is_requirement = True
 
-        if is_requirement:
-            req_text = content.strip()
-            if req_text and req_text not in requirements:
-                requirements.append(req_text)
+            if is_requirement:
+                req_text = content.strip()
+                if req_text and req_text not in seen:
+                    seen.add(req_text)
+                    requirements.append(req_text)
 
     return requirements
 
@@ -187,7 +226,7 @@ def crude_stem(word: str) -> str:
 
 def tokenize(text: str, remove_stopwords: bool = True, stem: bool = False) -> list[str]:
     """Tokenize text into lowercase words, optionally stemmed."""
-    tokens = re.findall(r"[a-z0-9]+", text.lower())
+    tokens = _TOKEN_RE.findall(text.lower())
     if remove_stopwords:
         tokens = [t for t in tokens if t not in STOPWORDS]
     if stem:
@@ -202,66 +241,124 @@ def extract_numbers(text: str) -> set[str]:
     Normalizes "5 minutes" and "5min" to comparable forms.
     """
     # Find all numbers (possibly with units)
-    patterns = re.findall(r"(\d+(?:\.\d+)?)\s*(%|ms|s|sec|min|minutes?|hours?|hr|days?|gb|mb|kb|tb|k\b)?", text.lower())
+    patterns = _NUM_RE.findall(text.lower())
     numbers = set()
     for num, unit in patterns:
         # Normalize units
         unit = unit.strip() if unit else ""
-        if unit in ("min", "minutes", "minute"):
-            unit = "min"
-        elif unit in ("sec", "s", "seconds", "second"):
-            unit = "s"
-        elif unit in ("hr", "hours", "hour"):
-            unit = "hr"
-        elif unit in ("days", "day"):
-            unit = "day"
+        unit = _UNIT_MAP.get(unit, unit)
         numbers.add(f"{num}{unit}")
         numbers.add(num)  # Also add raw number for looser matching
     return numbers
 
 
-def char_ngrams(text: str, n: int = 3) -> Counter:
+def char_ngrams(text: str, n: int = 3) -> tuple[Counter, float]:
     """Generate character n-grams (shingling) for a text.
 
-    Returns a Counter of n-gram frequencies for cosine similarity.
+    Returns a Counter of n-gram frequencies for cosine similarity, together
+    with the vector's magnitude so it is computed once per text rather than
+    once per comparison.
     """
-    text = re.sub(r"\s+", " ", text.lower().strip())
+    text = _WS_RE.sub(" ", text.lower().strip())
     if len(text) < n:
-        return Counter([text])
-    return Counter(text[i:i + n] for i in range(len(text) - n + 1))
+        ngrams = Counter([text])
+    else:
+        ngrams = Counter(text[i:i + n] for i in range(len(text) - n + 1))
+    return ngrams, math.sqrt(sum(v * v for v in ngrams.values()))
 
 
-def cosine_similarity_ngrams(ngrams_a: Counter, ngrams_b: Counter) -> float:
+def cosine_similarity_ngrams(
+    ngrams_a: Counter, mag_a: float, ngrams_b: Counter, mag_b: float
+) -> float:
     """Cosine similarity between two n-gram frequency vectors.
 
-    Implemented with stdlib only (Counter + math).
+    Implemented with stdlib only (Counter + math). Magnitudes come
+    precomputed from char_ngrams.
     """
     if not ngrams_a or not ngrams_b:
         return 0.0
 
-    # Dot product
-    common_keys = set(ngrams_a.keys()) & set(ngrams_b.keys())
-    dot_product = sum(ngrams_a[k] * ngrams_b[k] for k in common_keys)
-
-    # Magnitudes
-    mag_a = math.sqrt(sum(v * v for v in ngrams_a.values()))
-    mag_b = math.sqrt(sum(v * v for v in ngrams_b.values()))
-
     if mag_a == 0 or mag_b == 0:
         return 0.0
 
+    # Dot product: walk the smaller vector, look up in the larger
+    if len(ngrams_a) > len(ngrams_b):
+        ngrams_a, ngrams_b = ngrams_b, ngrams_a
+    # (no intersection set is materialized)
+    dot_product = 0
+    get_b = ngrams_b.get
+    for k, v in ngrams_a.items():
+        dot_product += v * get_b(k, 0)
+
     return dot_product / (mag_a * mag_b)
 
 
-def jaccard_similarity(tokens_a: list[str], tokens_b: list[str]) -> float:
-    """Jaccard similarity on token sets."""
-    set_a = set(tokens_a)
-    set_b = set(tokens_b)
-    if not set_a or not set_b:
+def jaccard_similarity(tokens_a: frozenset[str], tokens_b: frozenset[str]) -> float:
+    """Jaccard similarity on token sets.
+
+    |A ∪ B| is derived as |A| + |B| - |A ∩ B| so the union is never built.
+    """
+    if not tokens_a or not tokens_b:
         return 0.0
-    intersection = set_a & set_b
-    union = set_a | set_b
-    return len(intersection) / len(union)
+    intersection = len(tokens_a & tokens_b)
+    return intersection / (len(tokens_a) + len(tokens_b) - intersection)
+
+
+class RequirementFeatures(NamedTuple):
+    """Per-string matching features, computed once and reused across pairs."""
+
+    lower: str
+    tokens: frozenset[str]
+    stems: frozenset[str]
+    ngrams: Counter
+    ngram_magnitude: float
+    numbers: frozenset[str]
+
+
+@cache
+def requirement_features(text: str) -> RequirementFeatures:
+    """Compute (and memoize) the matching features of a requirement string.
+
+    fuzzy_match compares every requirement against many candidates, so the
+    same string is tokenized/shingled repeatedly without this cache.
+    """
+    lower = text.lower().strip()
+    ngrams, ngram_magnitude = char_ngrams(lower)
+    return RequirementFeatures(
+        lower=lower,
+        tokens=frozenset(tokenize(text)),
+        stems=frozenset(tokenize(text, stem=True)),
+        ngrams=ngrams,
+        ngram_magnitude=ngram_magnitude,
+        numbers=frozenset(extract_numbers(text)),
+    )
+
+
+@cache
+def _candidate_matcher(cand_lower: str) -> SequenceMatcher:
+    """SequenceMatcher with ``cand_lower`` preloaded as seq2.
+
+    set_seq2 builds the b2j index; the coverage checks compare each
+    candidate against many requirements, so the index is built once per
+    candidate and only seq1 is swapped per comparison.
+    """
+    matcher = SequenceMatcher(None)
+    matcher.set_seq2(cand_lower)
+    return matcher
+
+
+def _seq_ratio_at_least(matcher: SequenceMatcher, threshold: float) -> bool:
+    """Whether matcher.ratio() >= threshold, trying cheap upper bounds first.
+
+    difflib's real_quick_ratio() and quick_ratio() both bound ratio() from
+    above, so the exact Ratcliff/Obershelp ratio is only computed when both
+    clear the threshold.
+    """
+    if matcher.real_quick_ratio() < threshold:
+        return False
+    if matcher.quick_ratio() < threshold:
+        return False
+    return matcher.ratio() >= threshold
 
 
 def fuzzy_match(requirement: str, candidate: str, threshold: float = 0.45) -> bool:
@@ -277,40 +374,21 @@ def fuzzy_match(requirement: str, candidate: str, threshold: float = 0.45) -> bo
     A match on ANY strategy (above its threshold) is considered a match,
     BUT numeric disagreement can veto the match.
     """
-    req_lower = requirement.lower().strip()
-    cand_lower = candidate.lower().strip()
+    req = requirement_features(requirement)
+    cand = requirement_features(candidate)
+    req_lower = req.lower
+    cand_lower = cand.lower
 
     # Fast path: substring containment
     if req_lower in cand_lower or cand_lower in req_lower:
         return True
 
-    # Strategy 1: SequenceMatcher (Ratcliff/Obershelp)
-    # Uses Python's stdlib difflib — good for edit distance on similar strings
-    # Threshold 0.55 catches reworded but structurally similar sentences
-    seq_ratio = SequenceMatcher(None, req_lower, cand_lower).ratio()
-
-    # Strategy 2: Token Jaccard (word overlap, stopwords removed)
-    req_tokens = tokenize(requirement)
-    cand_tokens = tokenize(candidate)
-    jaccard = jaccard_similarity(req_tokens, cand_tokens)
-
-    # Strategy 3: Stemmed Token Jaccard (catches "rotatable"/"rotation",
-    # "concurrent"/"concurrency", "configurable"/"configuration")
-    req_stems = tokenize(requirement, stem=True)
-    cand_stems = tokenize(candidate, stem=True)
-    jaccard_stemmed = jaccard_similarity(req_stems, cand_stems)
-
-    # Strategy 4: Character 3-gram cosine similarity
-    # Good at catching partial phrase overlap and word reordering
-    req_ngrams = char_ngrams(req_lower)
-    cand_ngrams = char_ngrams(cand_lower)
-    ngram_cosine = cosine_similarity_ngrams(req_ngrams, cand_ngrams)
-
     # Strategy 5: Numeric agreement check
     # If the requirement contains numbers, the candidate must contain
-    # at least one matching number — otherwise it's likely a different requirement
-    req_numbers = extract_numbers(requirement)
-    cand_numbers = extract_numbers(candidate)
+    # at least one matching number — otherwise it's likely a different requirement.
+    # Checked first: it is cheap and vetoes every text strategy below.
+    req_numbers = req.numbers
+    cand_numbers = cand.numbers
 
     if req_numbers and cand_numbers:
         # Both have numbers — check if any overlap
@@ -320,65 +398,136 @@ def fuzzy_match(requirement: str, candidate: str, threshold: float = 0.45) -> bo
             # Even if text is similar (e.g., "timeout: 5 min" vs "timeout: 30 min")
             return False
 
-    # Combined decision: match if ANY text strategy exceeds its threshold
-    return (
-        seq_ratio >= 0.55
-        or jaccard >= threshold
-        or jaccard_stemmed >= (threshold - 0.05)
-        or ngram_cosine >= 0.5
+    # Match if ANY text strategy exceeds its threshold. Strategies run
+    # cheapest first and stop at the first that fires.
+
+    # Blocking prefilter: with no stem in common the token sets are disjoint
+    # too, so both Jaccard scores are 0 and need not be computed. The pair is
+    # not rejected outright — the character-level strategies below can still
+    # match token-disjoint text (e.g. "authentication" vs "authenticate").
+    shares_stem = not req.stems.isdisjoint(cand.stems)
+
+    # Strategy 2: Token Jaccard (word overlap, stopwords removed)
+    jaccard = jaccard_similarity(req.tokens, cand.tokens) if shares_stem else 0.0
+    if jaccard >= threshold:
+        return True
+
+    # Strategy 3: Stemmed Token Jaccard (catches "rotatable"/"rotation",
+    # "concurrent"/"concurrency", "configurable"/"configuration")
+    jaccard_stemmed = jaccard_similarity(req.stems, cand.stems) if shares_stem else 0.0
+    if jaccard_stemmed >= (threshold - 0.05):
+        return True
+
+    # Strategy 4: Character 3-gram cosine similarity
+    # Good at catching partial phrase overlap and word reordering
+    ngram_cosine = cosine_similarity_ngrams(
+        req.ngrams, req.ngram_magnitude, cand.ngrams, cand.ngram_magnitude
     )
+    if ngram_cosine >= 0.5:
+        return True
+
+    # Strategy 1: SequenceMatcher (Ratcliff/Obershelp)
+    # Uses Python's stdlib difflib — good for edit distance on similar strings
+    # Threshold 0.55 catches reworded but structurally similar sentences
+    matcher = _candidate_matcher(cand_lower)
+    matcher.set_seq1(req_lower)
+    return _seq_ratio_at_least(matcher, 0.55)
 
 
 # ---------------------------------------------------------------------------
 # Section extraction from brief.md
 # ---------------------------------------------------------------------------
 
-def extract_brief_section(brief_text: str, section_name: str) -> list[str]:
-    """Extract bullet items from a named section in brief.md.
+# Brief sections consulted by the coverage checks
+BRIEF_SECTIONS = ("Source Requirements", "IN")
+
 
-    Uses exact heading match for short section names (like "IN")
-    to avoid false matches on "Interface Contracts", "Enriched Context", etc.
+def extract_brief_sections(
+    brief_text: str, section_names: tuple[str, ...]
+) -> dict[str, list[str]]:
+    """Extract bullet items from several named sections of brief.md in one pass.
+
+    Each section name keeps its own in-section state, so the result for a
+    name is the same as a separate scan for it would give. Uses exact
+    heading match for short section names (like "IN") to avoid false
+    matches on "Interface Contracts", "Enriched Context", etc.
     """
-    lines = brief_text.splitlines()
-    items = []
-    in_section = False
-    section_depth = 0
+    items: dict[str, list[str]] = {name: [] for name in section_names}
+    # Per-name state: section depth while inside the section, else None
+    depths: dict[str, int | None] = dict.fromkeys(section_names)
 
-    for line in lines:
+    for line in brief_text.splitlines():
         stripped = line.strip()
 
         # Check for section heading
         if stripped.startswith("#"):
             heading_text = stripped.lstrip("#").strip()
             heading_depth = len(stripped) - len(stripped.lstrip("#"))
+            heading_upper = heading_text.upper()
+            heading_lower = heading_text.lower()
+
+            for name in section_names:
+                # For short section names (<=3 chars like "IN"), use exact match
+                # to avoid matching "Interface", "Enriched", etc.
+                if len(name) <= 3:
+                    matches = heading_upper == name.upper()
+                else:
+                    matches = name.lower() in heading_lower
+
+                if matches:
+                    depths[name] = heading_depth
+                elif depths[name] is not None and heading_depth <= depths[name]:
+                    depths[name] = None
+            continue
 
-            # For short section names (<=3 chars like "IN"), use exact match
-            # to avoid matching "Interface", "Enriched", etc.
-            if len(section_name) <= 3:
-                matches = heading_text.strip().upper() == section_name.upper()
-            else:
-                matches = section_name.lower() in heading_text.lower()
-
-            if matches:
-                in_section = True
-                section_depth = heading_depth
-                continue
-            elif in_section and heading_depth <= section_depth:
-                in_section = False
-                continue
-
-        if in_section and (stripped.startswith("- ") or stripped.startswith("* ")):
+        if stripped.startswith(("- ", "* ")):
             item = stripped[2:].strip()
             if item and not item.startswith("("):
-                items.append(item)
+                for name in section_names:
+                    if depths[name] is not None:
+                        items[name].append(item)
 
     return items
 
 
+def extract_brief_section(brief_text: str, section_name: str) -> list[str]:
+    """Extract bullet items from a named section in brief.md."""
+    return extract_brief_sections(brief_text, (section_name,))[section_name]
+
+
 # ---------------------------------------------------------------------------
 # Coverage checks
 # ---------------------------------------------------------------------------
 
+# Report items. Slotted dataclasses instead of per-item dicts keep large
+# reports compact; they are converted with asdict() only for JSON output.
+
+@dataclass(slots=True)
+class PresentItem:
+    track: str
+    requirement: str
+
+
+@dataclass(slots=True)
+class MissingItem:
+    track: str
+    requirement: str
+    reason: str
+
+
+@dataclass(slots=True)
+class GapItem:
+    track: str
+    requirement: str
+    section: str
+
+
+@dataclass(slots=True)
+class MappedItem:
+    requirement: str
+    tracks: list[str]
+
+
 def load_track_requirements(tracks_dir: str) -> dict[str, list[str]]:
     """Load requirements from each track's metadata.json."""
     tracks_path = Path(tracks_dir)
@@ -410,76 +559,147 @@ def load_requirements_map(map_path: str) -> dict[str, list[str]] | None:
         return json.load(f)
 
 
-def check_brief_coverage(tracks_dir: str, track_reqs: dict[str, list[str]]) -> dict:
-    """Check that each track's requirements appear in its brief.md Source Requirements."""
+# Below this many work items shipping them to the pool costs more than it saves
+PARALLEL_MIN_ITEMS = 16
+
+# Work items sent to a worker per task, so pickling is amortized
+PARALLEL_CHUNKSIZE = 8
+
+
+def _parallel_map(func, items: list, executor: Executor | None) -> list:
+    """map() over items, fanned out to ``executor`` when worthwhile.
+
+    fuzzy_match is pure-Python CPU work, so the executor should be a process
+    pool (threads would serialize on the GIL). Results come back in input
+    order either way.
+    """
+    if executor is None or len(items) < PARALLEL_MIN_ITEMS:
+        return [func(item) for item in items]
+    return list(executor.map(func, items, chunksize=PARALLEL_CHUNKSIZE))
+
+
+def _matches_any(item: tuple[str, list[str]], threshold: float = 0.45) -> bool:
+    """Whether a (requirement, candidates) pair has any fuzzy match."""
+    req, candidates = item
+    return any(fuzzy_match(req, c, threshold=threshold) for c in candidates)
+
+
+def load_brief_sections(
+    tracks_dir: str, track_ids: list[str]
+) -> dict[str, dict[str, list[str]]]:
+    """Read each track's brief.md once and extract the sections the checks use.
+
+    Returns {track_id: {"Source Requirements": [...], "IN": [...]}}. Tracks
+    without a brief.md are omitted.
+    """
     tracks_path = Path(tracks_dir)
+    briefs: dict[str, dict[str, list[str]]] = {}
+
+    for track_id in track_ids:
+        brief_path = tracks_path / track_id / "brief.md"
+        if not brief_path.exists():
+            continue
+        briefs[track_id] = extract_brief_sections(brief_path.read_text(), BRIEF_SECTIONS)
+
+    return briefs
+
+
+def check_brief_coverage(
+    track_reqs: dict[str, list[str]],
+    briefs: dict[str, dict[str, list[str]]],
+    executor: Executor | None = None,
+) -> dict:
+    """Check that each track's requirements appear in its brief.md Source Requirements."""
     present = []
     missing = []
 
+    work = [
+        (req, briefs[track_id]["Source Requirements"])
+        for track_id, reqs in track_reqs.items() if track_id in briefs
+        for req in reqs
+    ]
+    results = iter(_parallel_map(_matches_any, work, executor))
+
     for track_id, reqs in track_reqs.items():
-        brief_path = tracks_path / track_id / "brief.md"
-        if not brief_path.exists():
+        if track_id not in briefs:
             for req in reqs:
-                missing.append({"track": track_id, "requirement": req, "reason": "brief.md not found"})
+                missing.append(MissingItem(track_id, req, "brief.md not found"))
             continue
 
-        brief_text = brief_path.read_text()
-        brief_reqs = extract_brief_section(brief_text, "Source Requirements")
-
         for req in reqs:
-            found = any(fuzzy_match(req, br) for br in brief_reqs)
+            found = next(results)
             if found:
-                present.append({"track": track_id, "requirement": req})
+                present.append(PresentItem(track_id, req))
             else:
-                missing.append({"track": track_id, "requirement": req, "reason": "not in Source Requirements"})
+                missing.append(MissingItem(track_id, req, "not in Source Requirements"))
 
     return {"present": present, "missing": missing}
 
 
-def check_scope_coverage(tracks_dir: str, track_reqs: dict[str, list[str]]) -> dict:
+def check_scope_coverage(
+    track_reqs: dict[str, list[str]],
+    briefs: dict[str, dict[str, list[str]]],
+    executor: Executor | None = None,
+) -> dict:
     """Check that each requirement in Source Requirements has a Scope IN item."""
-    tracks_path = Path(tracks_dir)
     covered = []
     gaps = []
 
+    work = [
+        (req, briefs[track_id]["IN"])
+        for track_id, reqs in track_reqs.items() if track_id in briefs
+        for req in reqs
+    ]
+    results = iter(_parallel_map(partial(_matches_any, threshold=0.35), work, executor))
+
     for track_id, reqs in track_reqs.items():
-        brief_path = tracks_path / track_id / "brief.md"
-        if not brief_path.exists():
+        if track_id not in briefs:
             continue
 
-        brief_text = brief_path.read_text()
-        scope_items = extract_brief_section(brief_text, "IN")
-
         for req in reqs:
-            found = any(fuzzy_match(req, si, threshold=0.35) for si in scope_items)
+            found = next(results)
             if found:
-                covered.append({"track": track_id, "requirement": req})
+                covered.append(PresentItem(track_id, req))
             else:
-                gaps.append({"track": track_id, "requirement": req, "section": "Scope IN"})
+                gaps.append(GapItem(track_id, req, "Scope IN"))
 
     return {"covered": covered, "gaps": gaps}
 
 
+def _matching_tracks(preq: str, track_reqs: dict[str, list[str]]) -> list[str]:
+    """Track IDs with at least one requirement matching ``preq``.
+
+    Shared requirements are often copied into several tracks' metadata, so
+    each distinct requirement string is compared against ``preq`` only once.
+    """
+    verdicts: dict[str, bool] = {}
+
+    def matches(req: str) -> bool:
+        verdict = verdicts.get(req)
+        if verdict is None:
+            verdict = verdicts[req] = fuzzy_match(preq, req)
+        return verdict
+
+    return [
+        tid for tid, reqs in track_reqs.items()
+        if any(matches(r) for r in reqs)
+    ]
+
+
 def check_product_coverage(
-    product_reqs: list[str], track_reqs: dict[str, list[str]]
+    product_reqs: list[str], track_reqs: dict[str, list[str]],
+    executor: Executor | None = None,
 ) -> dict:
     """Check that each product.md requirement appears in at least one track."""
-    all_track_reqs = []
-    for reqs in track_reqs.values():
-        all_track_reqs.extend(reqs)
-
     mapped = []
     unmapped = []
 
-    for preq in product_reqs:
-        found = any(fuzzy_match(preq, tr) for tr in all_track_reqs)
-        if found:
-            # Find which tracks
-            tracks = []
-            for tid, reqs in track_reqs.items():
-                if any(fuzzy_match(preq, r) for r in reqs):
-                    tracks.append(tid)
-            mapped.append({"requirement": preq, "tracks": tracks})
+    results = _parallel_map(
+        partial(_matching_tracks, track_reqs=track_reqs), product_reqs, executor
+    )
+    for preq, tracks in zip(product_reqs, results):
+        if tracks:
+            mapped.append(MappedItem(preq, tracks))
         else:
             unmapped.append(preq)
 
@@ -514,6 +734,12 @@ def main():
         default="text",
         help="Output format (default: text)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the coverage checks (default: 1, no pool)",
+    )
 
     args = parser.parse_args()
 
@@ -529,14 +755,20 @@ def main():
     else:
         track_reqs = load_track_requirements(args.tracks_dir)
 
-    # Step 3: Check product.md → tracks coverage
-    product_coverage = check_product_coverage(product_reqs, track_reqs)
+    # One worker pool, if any, shared by Steps 3-5
+    with (ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1
+          else nullcontext()) as executor:
+        # Step 3: Check product.md → tracks coverage
+        product_coverage = check_product_coverage(product_reqs, track_reqs, executor)
+
+        # Each brief.md is read and parsed once, shared by Steps 4 and 5
+        briefs = load_brief_sections(args.tracks_dir, list(track_reqs))
 
-    # Step 4: Check tracks → briefs coverage
-    brief_coverage = check_brief_coverage(args.tracks_dir, track_reqs)
+        # Step 4: Check tracks → briefs coverage
+        brief_coverage = check_brief_coverage(track_reqs, briefs, executor)
 
-    # Step 5: Check briefs → scope coverage
-    scope_coverage = check_scope_coverage(args.tracks_dir, track_reqs)
+        # Step 5: Check briefs → scope coverage
+        scope_coverage = check_scope_coverage(track_reqs, briefs, executor)
 
     # Build report
     total_product = len(product_reqs)
@@ -557,10 +789,10 @@ def main():
         "unmapped": product_coverage["unmapped"],
         "total_track_requirements": total_track_reqs,
         "present_in_briefs": total_in_briefs,
-        "missing_from_briefs": brief_coverage["missing"],
+        "missing_from_briefs": [asdict(item) for item in brief_coverage["missing"]],
         "scope_coverage": {
             "covered": total_scope_covered,
-            "gaps": scope_coverage["gaps"],
+            "gaps": [asdict(gap) for gap in scope_coverage["gaps"]],
         },
         "brief_coverage_pct": round(brief_pct, 1),
         "scope_coverage_pct": round(scope_pct, 1),
@@ -583,12 +815,12 @@ def main():
         if total_missing_from_briefs > 0:
             print("\n  MISSING from briefs (in metadata but not in brief Source Requirements):")
             for item in brief_coverage["missing"]:
-                print(f"    - Track {item['track']}: \"{item['requirement']}\" — {item['reason']}")
+                print(f"    - Track {item.track}: \"{item.requirement}\" — {item.reason}")
         print(f"\n  Scope IN coverage: {total_scope_covered}/{total_track_reqs} ({round(scope_pct, 1)}%)")
         if total_scope_gaps > 0:
             print("\n  GAPS (requirement in brief but not in Scope IN):")
             for gap in scope_coverage["gaps"]:
-                print(f"    - Track {gap['track']}: \"{gap['requirement']}\" — not in {gap['section']}")
+                print(f"    - Track {gap.track}: \"{gap.requirement}\" — not in {gap.section}")
 
         if not has_gaps:
             print("\n  All requirements covered.")
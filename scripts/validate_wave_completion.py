@@ -3,16 +3,20 @@
 
 Given a wave number, checks each track in that wave for:
 1. All phases marked complete in plan.md
-2. Tests passing (runs test_command from metadata.json)
+2. Tests passing (runs test_command from metadata.json; skipped when the
+   prerequisite or phase checks have already failed the track)
 3. No BLOCKING discoveries in pending/
 4. All patches with blocks_wave == next_wave are COMPLETE
 
 Usage:
     python scripts/validate_wave_completion.py --wave 2
     python scripts/validate_wave_completion.py --wave 2 --skip-tests
+    python scripts/validate_wave_completion.py --wave 2 --jobs 4
+    python scripts/validate_wave_completion.py --wave 2 --compact
+    python scripts/validate_wave_completion.py --wave 2 --stream
     python scripts/validate_wave_completion.py --wave 2 --tracks-dir conductor/tracks
 
-Output (JSON to stdout):
+Output (JSON to stdout; indented, or on one line with --compact):
     {
       "wave": 2,
       "passed": false,
@@ -22,51 +26,122 @@ Output (JSON to stdout):
       ],
       "summary": { "pass": 2, "fail": 1, "warn": 0 }
     }
+
+With --stream, each result is printed as its own JSON line once its track
+is checked, and the last line carries the verdict:
+    {"_final": true, "wave": 2, "passed": false, "summary": {...}}
 """
 
 import argparse
 import json
+import os
 import re
+import shlex
+import signal
 import subprocess
 import sys
-from datetime import UTC
-from pathlib import Path
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+# Lines of test output quoted when a track's tests fail
+OUTPUT_TAIL_LINES = 5
+
+# Characters that need /bin/sh to interpret a test command (pipes, lists,
+# redirection, expansion, globbing, comments); plain commands skip the shell
+_SHELL_METACHARS = frozenset("|&;<>()$`\\*?[]#~!\n")
+
+# Test commands still running. Each runs in its own session, so a Ctrl-C at
+# the terminal never reaches it; an interrupted run kills these instead
+_live_tests: set[subprocess.Popen] = set()
+_live_tests_lock = threading.Lock()
+_aborting = threading.Event()
+
+# Task checkbox in plan.md: "- [ ]" open, "- [x]" / "- [X]" done. Matched
+# against raw bytes: every marker we look for is ASCII, so decoding is skipped
+_CHECKBOX_RE = re.compile(rb"- \[([ xX])\]")
+
+
+def _load_meta(meta_path: str, meta_cache: dict[str, dict] | None = None) -> dict:
+    """Parse a metadata.json, memoized in meta_cache when one is given.
+
+    main() passes one dict for the whole run: prerequisite checks re-read
+    the same files for every dependent track, and load_wave_tracks fills it
+    for the wave being validated. Cached dicts must not be mutated.
+    """
+    if meta_cache is not None:
+        meta = meta_cache.get(meta_path)
+        if meta is not None:
+            return meta
+
+    with open(meta_path) as f:
+        meta = json.load(f)
+    if meta_cache is not None:
+        meta_cache[meta_path] = meta
+    return meta
+
+
+@dataclass(slots=True)
+class TrackCtx:
+    """A wave track with its paths resolved once at load time.
+
+    meta is the cached metadata dict, shared with prerequisite checks, so
+    it must not be mutated.
+    """
+    track_dir: str
+    plan_path: str
+    meta: dict
 
 
-def load_wave_tracks(wave: int, tracks_dir: str) -> list[dict]:
+def load_wave_tracks(
+    wave: int, tracks_dir: str, meta_cache: dict[str, dict] | None = None
+) -> list[TrackCtx]:
     """Load metadata for all tracks in the given wave."""
     tracks = []
-    tracks_path = Path(tracks_dir)
 
-    if not tracks_path.exists():
+    if not os.path.exists(tracks_dir):
         print(f"Error: tracks directory not found: {tracks_dir}", file=sys.stderr)
         sys.exit(1)
 
-    for meta_path in sorted(tracks_path.glob("*/metadata.json")):
-        try:
-            with open(meta_path) as f:
-                meta = json.load(f)
-            if meta.get("wave") == wave:
-                meta["_dir"] = str(meta_path.parent)
-                tracks.append(meta)
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"Warning: skipping {meta_path}: {e}", file=sys.stderr)
-
-    return tracks
-
-
-def check_phases_complete(track_dir: str) -> tuple[bool, str]:
+    # Stream the listing (scandir entries carry their file type, so no extra
+    # stat per directory) and keep only this wave's tracks
+    with os.scandir(tracks_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            meta_path = entry.path + os.sep + "metadata.json"
+            try:
+                meta = _load_meta(meta_path, meta_cache)
+                if meta.get("wave") == wave:
+                    plan_path = entry.path + os.sep + "plan.md"
+                    tracks.append((entry.name, TrackCtx(entry.path, plan_path, meta)))
+            except (FileNotFoundError, IsADirectoryError):
+                # Not a track: the open doubles as the existence check
+                continue
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"Warning: skipping {meta_path}: {e}", file=sys.stderr)
+
+    # Report in directory-name order, sorting only the matched tracks
+    tracks.sort(key=lambda item: item[0])
+    return [track for _, track in tracks]
+
+
+def check_phases_complete(plan_path: str) -> tuple[bool, str]:
     """Check if all phases in plan.md are complete (all checkboxes checked)."""
-    plan_path = Path(track_dir) / "plan.md"
-    if not plan_path.exists():
+    try:
+        with open(plan_path, "rb") as f:
+            text = f.read()
+    except (FileNotFoundError, NotADirectoryError):
         return False, "plan.md not found"
 
-    text = plan_path.read_text()
-
-    # Count checkboxes
-    checked = len(re.findall(r"- \[x\]", text, re.IGNORECASE))
-    unchecked = len(re.findall(r"- \[ \]", text))
-    total = checked + unchecked
+    # Count checkboxes in one pass over the text
+    total = unchecked = 0
+    for match in _CHECKBOX_RE.finditer(text):
+        total += 1
+        unchecked += match.group(1) == b" "
 
     if total == 0:
         return False, "No task checkboxes found in plan.md"
@@ -77,46 +152,227 @@ def check_phases_complete(track_dir: str) -> tuple[bool, str]:
     return True, f"All {total} tasks complete"
 
 
+def _kill_process_tree(proc: subprocess.Popen) -> None:
+    """Kill a test command together with everything it spawned.
+
+    Killing just the direct child (e.g. the shell, or a runner that forks
+    workers) would leave the real test processes orphaned and still
+    running after its timeout.
+    """
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass
+    proc.kill()
+
+
+def _collect_tail(stream, sink: list[str], keep: int = OUTPUT_TAIL_LINES) -> None:
+    """Drain a pipe to EOF, keeping only what the failure snippet can show.
+
+    Retains the last ``keep`` lines up to the final non-blank line plus up
+    to ``keep`` trailing blank lines, so memory stays bounded however chatty
+    the suite is. Lines dropped ahead of the retained ones are replaced by a
+    single placeholder line so the tail does not fuse with the other
+    stream's output, and — if real content was dropped — so stripping the
+    combined output cannot eat into the retained lines.
+    """
+    tail: deque[str] = deque(maxlen=keep)
+    blanks: deque[str] = deque(maxlen=keep)
+    blank_run = committed = content_lines = 0
+
+    with stream:
+        for line in stream:
+            if line.strip():
+                tail.extend(blanks)
+                tail.append(line)
+                committed += blank_run + 1
+                content_lines += 1
+                blanks.clear()
+                blank_run = 0
+            else:
+                blanks.append(line)
+                blank_run += 1
+
+    placeholder = ""
+    if committed > len(tail):
+        dropped_content = content_lines > sum(1 for line in tail if line.strip())
+        placeholder = "...\n" if dropped_content else "\n"
+    sink.append(placeholder + "".join(tail) + "".join(blanks))
+
+
+def _split_command(test_command: str) -> list[str] | None:
+    """Split a plain test command into argv, or None if it needs a shell."""
+    if not _SHELL_METACHARS.isdisjoint(test_command):
+        return None
+    try:
+        return shlex.split(test_command) or None
+    except ValueError:  # unbalanced quotes: let the shell report it
+        return None
+
+
+def _spawn(args: str | list[str], shell: bool) -> subprocess.Popen:
+    # Own session (POSIX) so a timeout can kill the whole process group
+    proc = subprocess.Popen(
+        args,
+        shell=shell,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        start_new_session=True,
+    )
+    with _live_tests_lock:
+        _live_tests.add(proc)
+        if _aborting.is_set():
+            # Started after abort_running_tests() swept the others
+            _kill_process_tree(proc)
+    return proc
+
+
+def abort_running_tests() -> None:
+    """Kill every running test command's process group.
+
+    Used when the run itself is interrupted: the test commands are in their
+    own sessions, so they did not receive the signal, and the worker threads
+    waiting on them would otherwise keep the process alive until each suite
+    finishes or times out.
+    """
+    with _live_tests_lock:
+        _aborting.set()
+        for proc in _live_tests:
+            _kill_process_tree(proc)
+
+
 def run_tests(test_command: str, timeout: int = 300) -> tuple[bool, str]:
-    """Run the track's test command and return pass/fail."""
+    """Run the track's test command and return pass/fail.
+
+    Plain commands are executed directly, saving a /bin/sh spawn per track;
+    anything using shell syntax still runs through the shell.
+    """
     try:
-        result = subprocess.run(
-            test_command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-        if result.returncode == 0:
-            return True, "Tests passing"
-        else:
-            # Get last few lines of output for context
-            output = result.stdout + result.stderr
-            last_lines = "\n".join(output.strip().splitlines()[-5:])
-            return False, f"Tests failing (exit {result.returncode}): {last_lines[:200]}"
-    except subprocess.TimeoutExpired:
-        return False, f"Tests timed out after {timeout}s"
+        argv = _split_command(test_command)
+        try:
+            proc = _spawn(test_command if argv is None else argv, shell=argv is None)
+        except OSError:
+            if argv is None:
+                raise
+            # Not a program on PATH (a shell builtin, a VAR=value prefix, a
+            # typo): the shell gives these their usual meaning and exit codes
+            proc = _spawn(test_command, shell=True)
     except OSError as e:
         return False, f"Failed to run tests: {e}"
 
+    # Output is streamed through bounded tails rather than buffered whole
+    stdout_tail: list[str] = []
+    stderr_tail: list[str] = []
+    readers = [
+        threading.Thread(target=_collect_tail, args=(pipe, sink), daemon=True)
+        for pipe, sink in ((proc.stdout, stdout_tail), (proc.stderr, stderr_tail))
+    ]
+    for reader in readers:
+        reader.start()
+
+    deadline = time.monotonic() + timeout
+    try:
+        proc.wait(timeout=timeout)
+        # A background child may still hold the pipes open; same deadline
+        for reader in readers:
+            reader.join(max(0.0, deadline - time.monotonic()))
+        if any(reader.is_alive() for reader in readers):
+            raise subprocess.TimeoutExpired(test_command, timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_tree(proc)
+        proc.wait()
+        return False, f"Tests timed out after {timeout}s"
+    finally:
+        with _live_tests_lock:
+            _live_tests.discard(proc)
+
+    if proc.returncode == 0:
+        return True, "Tests passing"
+    else:
+        # Get last few lines of output for context
+        output = stdout_tail[0] + stderr_tail[0]
+        last_lines = "\n".join(output.strip().splitlines()[-OUTPUT_TAIL_LINES:])
+        return False, f"Tests failing (exit {proc.returncode}): {last_lines[:200]}"
+
+
+def load_pending_discoveries(discovery_dir: str) -> list[tuple[str, bytes]] | None:
+    """Read the BLOCKING pending discoveries once, as (filename, raw bytes) pairs.
+
+    Returns None when there is no pending/ directory. Whether a discovery is
+    blocking does not depend on the track, so it is decided here once per
+    file; per-track checks then only need to match the track ID.
+    """
+    pending_dir = os.path.join(discovery_dir, "pending")
+    if not os.path.isdir(pending_dir):
+        return None
+
+    discoveries = []
+    with os.scandir(pending_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".md") and entry.is_file():
+                with open(entry.path, "rb") as f:
+                    text = f.read()
+                if b"BLOCKING" in text and b"**Urgency:**" in text:
+                    discoveries.append((entry.name, text))
+    return discoveries
+
+
+def index_blocking_discoveries(
+    discoveries: list[tuple[str, bytes]] | None, track_ids: list[str]
+) -> dict[str, list[str]] | None:
+    """Map each track ID to the blocking discoveries that belong to it.
+
+    A discovery belongs to a track when the track ID appears anywhere in its
+    filename or "Track <id>" appears in its text. Rather than testing every
+    track against every discovery, each filename and each "Track " tag is
+    probed once per distinct ID length, so the cost no longer scales with
+    tracks x discoveries. Names keep their pending/ order per track.
+    """
+    if discoveries is None:
+        return None
+
+    ids = set(track_ids)
+    id_lengths = sorted({len(tid) for tid in ids})
+    tag_ids = {tid.encode(): tid for tid in ids}
+    tag_lengths = sorted({len(tag) for tag in tag_ids})
+    tag_prefix = b"Track "
+
+    by_track: dict[str, list[str]] = {tid: [] for tid in ids}
+    for name, text in discoveries:
+        owners = set()
+        for n in id_lengths:
+            for start in range(len(name) - n + 1):
+                if name[start:start + n] in ids:
+                    owners.add(name[start:start + n])
+
+        pos = text.find(tag_prefix)
+        while pos != -1:
+            start = pos + len(tag_prefix)
+            for n in tag_lengths:
+                if start + n > len(text):
+                    break
+                tid = tag_ids.get(text[start:start + n])
+                if tid is not None:
+                    owners.add(tid)
+            pos = text.find(tag_prefix, pos + 1)
+
+        for tid in owners:
+            by_track[tid].append(name)
+    return by_track
+
 
 def check_blocking_discoveries(
-    track_id: str, discovery_dir: str
+    track_id: str, blocking_by_track: dict[str, list[str]] | None
 ) -> tuple[bool, str]:
     """Check for BLOCKING discoveries from this track in pending/."""
-    pending_dir = Path(discovery_dir) / "pending"
-    if not pending_dir.exists():
+    if blocking_by_track is None:
         return True, "No pending discoveries directory"
 
-    blocking = []
-    for fp in pending_dir.glob("*.md"):
-        text = fp.read_text()
-        # Check if this discovery is from our track and is BLOCKING
-        is_from_track = track_id in fp.name or f"Track {track_id}" in text
-        is_blocking = "BLOCKING" in text and "**Urgency:**" in text
-
-        if is_from_track and is_blocking:
-            blocking.append(fp.name)
+    blocking = blocking_by_track.get(track_id, [])
 
     if blocking:
         return False, f"{len(blocking)} blocking discoveries: {', '.join(blocking[:3])}"
@@ -124,28 +380,43 @@ def check_blocking_discoveries(
     return True, "No blocking discoveries"
 
 
+def list_track_dirs(tracks_dir: str) -> dict[str, str]:
+    """Map each track directory name under tracks_dir to its path."""
+    with os.scandir(tracks_dir) as entries:
+        return {entry.name: entry.path for entry in entries if entry.is_dir()}
+
+
 def check_test_prerequisites(
-    meta: dict, all_tracks_dir: str
+    meta: dict, all_tracks_dir: str, track_dirs: dict[str, str] | None = None,
+    meta_cache: dict[str, dict] | None = None,
 ) -> tuple[bool, str]:
-    """Check that test prerequisites (other tracks) are completed."""
+    """Check that test prerequisites (other tracks) are completed.
+
+    track_dirs, from list_track_dirs(), lets many tracks share one listing of
+    all_tracks_dir instead of probing the filesystem once per prerequisite;
+    meta_cache (see _load_meta) lets them share the parsed metadata.
+    """
     prereqs = meta.get("test_prerequisites", [])
     if not prereqs:
         return True, "No test prerequisites"
 
-    tracks_path = Path(all_tracks_dir)
     incomplete = []
 
     for prereq_id in prereqs:
-        prereq_meta_path = tracks_path / prereq_id / "metadata.json"
-        if not prereq_meta_path.exists():
-            incomplete.append(f"{prereq_id} (not found)")
-            continue
+        if track_dirs is None:
+            prereq_dir = os.path.join(all_tracks_dir, prereq_id)
+        else:
+            prereq_dir = track_dirs.get(prereq_id)
+            if prereq_dir is None:
+                incomplete.append(f"{prereq_id} (not found)")
+                continue
 
         try:
-            with open(prereq_meta_path) as f:
-                prereq_meta = json.load(f)
+            prereq_meta = _load_meta(prereq_dir + os.sep + "metadata.json", meta_cache)
             if prereq_meta.get("status") != "completed":
                 incomplete.append(f"{prereq_id} ({prereq_meta.get('status', 'unknown')})")
+        except (FileNotFoundError, NotADirectoryError):
+            incomplete.append(f"{prereq_id} (not found)")
         except (json.JSONDecodeError, OSError):
             incomplete.append(f"{prereq_id} (unreadable)")
 
@@ -171,23 +442,23 @@ def check_quality_threshold(
 
 
 def log_override(
-    meta: dict, meta_path: Path, check: str, reason: str
+    meta: dict, meta_path: str | os.PathLike[str], check: str, reason: str
 ) -> None:
     """Append an override entry to metadata.json override_log."""
-    from datetime import datetime
     override_entry = {
         "check": check,
         "reason": reason,
         "timestamp": datetime.now(UTC).isoformat(),
     }
 
-    override_log = meta.get("override_log", [])
-    override_log.append(override_entry)
-    meta["override_log"] = override_log
+    meta.setdefault("override_log", []).append(override_entry)
 
+    # Serialize up front: one write() call instead of json.dump's many small
+    # chunk writes, and the file is never left truncated by an encode error
+    serialized = json.dumps(meta, indent=2)
     try:
         with open(meta_path, "w") as f:
-            json.dump(meta, f, indent=2)
+            f.write(serialized)
     except OSError as e:
         print(f"Warning: could not write override to {meta_path}: {e}", file=sys.stderr)
 
@@ -207,6 +478,14 @@ def check_patches(meta: dict, next_wave: int) -> tuple[bool, str]:
     return True, "All patches complete" if patches else "No patches"
 
 
+def emit(output: dict, compact: bool) -> None:
+    """Print the report as one JSON document, compact or indented."""
+    if compact:
+        print(json.dumps(output, separators=(",", ":")))
+    else:
+        print(json.dumps(output, indent=2))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate wave completion quality gate"
@@ -219,80 +498,142 @@ def main():
                         help="Path to discovery directory")
     parser.add_argument("--skip-tests", action="store_true",
                         help="Skip running test commands")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Test commands to run concurrently (default: 1). Only "
+                             "raise it when the suites share no ports, databases "
+                             "or files")
+    parser.add_argument("--compact", action="store_true",
+                        help="Emit compact single-line JSON instead of indented")
+    parser.add_argument("--stream", action="store_true",
+                        help="Emit one JSON result per line as each track finishes, "
+                             "then a final summary line")
 
     args = parser.parse_args()
-    tracks = load_wave_tracks(args.wave, args.tracks_dir)
+    compact = args.stream or args.compact
+    # Parsed metadata.json files, shared by every check in this run
+    meta_cache: dict[str, dict] = {}
+    tracks = load_wave_tracks(args.wave, args.tracks_dir, meta_cache)
     next_wave = args.wave + 1
 
     if not tracks:
-        print(json.dumps({
+        emit({
+            **({"_final": True} if args.stream else {}),
             "wave": args.wave,
             "passed": False,
             "results": [],
             "summary": {"pass": 0, "fail": 0, "warn": 0},
             "message": f"No tracks found for wave {args.wave}",
-        }, indent=2))
+        }, compact)
         sys.exit(1)
 
     results = []
     summary = {"pass": 0, "fail": 0, "warn": 0}
+    blocking_by_track = index_blocking_discoveries(
+        load_pending_discoveries(args.discovery_dir),
+        [track.meta["track_id"] for track in tracks],
+    )
+
+    # 1-2. Cheap file checks first, so a track that cannot pass anyway
+    # doesn't spend up to its test timeout running the suite
+    track_dirs = list_track_dirs(args.tracks_dir)
+    prechecks = [
+        (
+            check_test_prerequisites(track.meta, args.tracks_dir, track_dirs, meta_cache),
+            check_phases_complete(track.plan_path),
+        )
+        for track in tracks
+    ]
 
-    for meta in tracks:
-        tid = meta["track_id"]
-        track_dir = meta["_dir"]
-        track_ok = True
-
-        # 1. Check test prerequisites
-        prereq_ok, prereq_msg = check_test_prerequisites(meta, args.tracks_dir)
-        if not prereq_ok:
-            results.append({"status": "FAIL", "track_id": tid, "check": "prerequisites", "message": prereq_msg})
-            track_ok = False
-
-        # 2. Check phases
-        phases_ok, phases_msg = check_phases_complete(track_dir)
-        if not phases_ok:
-            results.append({"status": "FAIL", "track_id": tid, "check": "phases", "message": phases_msg})
-            track_ok = False
-
-        # 3. Check tests
-        test_cmd = meta.get("test_command")
-        if test_cmd and not args.skip_tests:
-            timeout = meta.get("test_timeout_seconds", 300)
-            tests_ok, tests_msg = run_tests(test_cmd, timeout)
-            if not tests_ok:
-                results.append({"status": "FAIL", "track_id": tid, "check": "tests", "message": tests_msg})
+    # With --jobs > 1 test commands run concurrently (threads just wait on
+    # the children). Results are collected in track order as each one's
+    # tests finish.
+    executor = ThreadPoolExecutor(max_workers=max(1, args.jobs))
+    _aborting.clear()  # an earlier in-process run may have been interrupted
+    test_futures = [
+        executor.submit(
+            run_tests,
+            track.meta["test_command"],
+            track.meta.get("test_timeout_seconds", 300),
+        )
+        if track.meta.get("test_command") and not args.skip_tests
+        and all(ok for ok, _ in precheck) else None
+        for track, precheck in zip(tracks, prechecks)
+    ]
+    executor.shutdown(wait=False)
+
+    try:
+        for track, precheck, test_future in zip(tracks, prechecks, test_futures):
+            meta = track.meta
+            tid = meta["track_id"]
+            track_ok = True
+            (prereq_ok, prereq_msg), (phases_ok, phases_msg) = precheck
+
+            # 1. Check test prerequisites
+            if not prereq_ok:
+                results.append({"status": "FAIL", "track_id": tid, "check": "prerequisites", "message": prereq_msg})
+                track_ok = False
+
+            # 2. Check phases
+            if not phases_ok:
+                results.append({"status": "FAIL", "track_id": tid, "check": "phases", "message": phases_msg})
                 track_ok = False
-        elif not test_cmd:
-            results.append({"status": "WARN", "track_id": tid, "check": "tests", "message": "No test_command in metadata"})
-            summary["warn"] += 1
-        elif args.skip_tests:
-            results.append({"status": "WARN", "track_id": tid, "check": "tests", "message": "Tests skipped (--skip-tests)"})
-            summary["warn"] += 1
-
-        # 4. Check quality thresholds (advisory)
-        thresh_ok, thresh_msg = check_quality_threshold(meta)
-        if thresh_ok and "advisory" in thresh_msg:
-            results.append({"status": "INFO", "track_id": tid, "check": "quality", "message": thresh_msg})
-
-        # 5. Check blocking discoveries
-        disc_ok, disc_msg = check_blocking_discoveries(tid, args.discovery_dir)
-        if not disc_ok:
-            results.append({"status": "FAIL", "track_id": tid, "check": "discoveries", "message": disc_msg})
-            track_ok = False
-
-        # 6. Check patches
-        patches_ok, patches_msg = check_patches(meta, next_wave)
-        if not patches_ok:
-            results.append({"status": "FAIL", "track_id": tid, "check": "patches", "message": patches_msg})
-            track_ok = False
-
-        if track_ok:
-            results.append({"status": "PASS", "track_id": tid, "check": "all", "message": "All checks passed"})
-            summary["pass"] += 1
-        else:
-            summary["fail"] += 1
+
+            # 3. Check tests
+            test_cmd = meta.get("test_command")
+            if test_future is not None:
+                tests_ok, tests_msg = test_future.result()
+                if not tests_ok:
+                    results.append({"status": "FAIL", "track_id": tid, "check": "tests", "message": tests_msg})
+                    track_ok = False
+            elif test_cmd and not args.skip_tests:
+                results.append({"status": "INFO", "track_id": tid, "check": "tests", "message": "Tests not run: earlier checks failed"})
+            elif not test_cmd:
+                results.append({"status": "WARN", "track_id": tid, "check": "tests", "message": "No test_command in metadata"})
+                summary["warn"] += 1
+            elif args.skip_tests:
+                results.append({"status": "WARN", "track_id": tid, "check": "tests", "message": "Tests skipped (--skip-tests)"})
+                summary["warn"] += 1
+
+            # 4. Check quality thresholds (advisory)
+            thresh_ok, thresh_msg = check_quality_threshold(meta)
+            if thresh_ok and "advisory" in thresh_msg:
+                results.append({"status": "INFO", "track_id": tid, "check": "quality", "message": thresh_msg})
+
+            # 5. Check blocking discoveries
+            disc_ok, disc_msg = check_blocking_discoveries(tid, blocking_by_track)
+            if not disc_ok:
+                results.append({"status": "FAIL", "track_id": tid, "check": "discoveries", "message": disc_msg})
+                track_ok = False
+
+            # 6. Check patches
+            patches_ok, patches_msg = check_patches(meta, next_wave)
+            if not patches_ok:
+                results.append({"status": "FAIL", "track_id": tid, "check": "patches", "message": patches_msg})
+                track_ok = False
+
+            if track_ok:
+                results.append({"status": "PASS", "track_id": tid, "check": "all", "message": "All checks passed"})
+                summary["pass"] += 1
+            else:
+                summary["fail"] += 1
+
+            if args.stream:
+                for result in results:
+                    print(json.dumps(result, separators=(",", ":")), flush=True)
+                results.clear()
+    except BaseException:
+        # Ctrl-C (or any error) while suites run: they are in their own
+        # sessions and never saw the signal, and the pool's threads would
+        # keep waiting on them, so kill them and drop the queued ones
+        executor.shutdown(wait=False, cancel_futures=True)
+        abort_running_tests()
+        raise
 
     passed = summary["fail"] == 0
+    if args.stream:
+        emit({"_final": True, "wave": args.wave, "passed": passed, "summary": summary}, compact)
+        sys.exit(0 if passed else 1)
+
     output = {
         "wave": args.wave,
         "passed": passed,
@@ -300,7 +641,7 @@ def main():
         "summary": summary,
     }
 
-    print(json.dumps(output, indent=2))
+    emit(output, compact)
     sys.exit(0 if passed else 1)
 
 
@@ -0,0 +1,34 @@
+"""Shared helper for the scripts' in-process integration tests.
+
+Imported by the test modules after they put tests/ on sys.path, so it
+works under both pytest and ``python -m unittest``.
+"""
+
+import io
+import subprocess
+import sys
+from collections.abc import Callable
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+
+def run_main(main: Callable[[list[str]], object],
+             args: list[str], stdin: str = "") -> subprocess.CompletedProcess:
+    """Call a script's main(argv) in-process, capturing output and exit code."""
+    out, err = io.StringIO(), io.StringIO()
+    returncode = 0
+    with (redirect_stdout(out), redirect_stderr(err),
+          mock.patch.object(sys, "stdin", io.StringIO(stdin))):
+        try:
+            main(args)
+        except SystemExit as e:
+            # Mirror the interpreter: None is success, an int is the status,
+            # anything else is printed to stderr and exits with 1
+            if e.code is None or isinstance(e.code, int):
+                returncode = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+    return subprocess.CompletedProcess(
+        args, returncode, out.getvalue(), err.getvalue(),
+    )
@@ -39,24 +39,27 @@ What CAN be tested:
 
 import argparse
 import json
+import os
 import re
 import sys
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 # -------------------------------------------------------------------
 # Test infrastructure
 # -------------------------------------------------------------------
 
-class TestResult:
-    __slots__ = ("group", "message", "name", "passed", "severity")
 
-    def __init__(self, name: str, group: str, passed: bool,
-                 message: str, severity: str = "CRITICAL"):
-        self.name = name
-        self.group = group
-        self.passed = passed
-        self.message = message
-        self.severity = severity
+class TestResult(NamedTuple):
+    # Tuple-backed: cheaper to build than an object with five attribute stores
+    name: str
+    group: str
+    passed: bool
+    message: str
+    severity: str = "CRITICAL"
 
 
 # Mapping from --only shorthand to group-name prefix
@@ -72,47 +75,153 @@ GROUP_ALIASES = {
     "negative": "Negative",
 }
 
+# Conductor's track status enum, and Architect's pre-Conductor values
+VALID_STATUSES = frozenset({
+    "new", "in_progress", "completed",
+    "needs_patch", "paused", "blocked",
+})
+OLD_STATUSES = frozenset({"NOT_STARTED", "IN_PROGRESS", "COMPLETE", "NEEDS_PATCH"})
+# Listing used in failure messages, sorted once
+_VALID_STATUSES_SORTED = sorted(VALID_STATUSES)
+
+# Patterns shared by the validators, compiled once per run
+
+# Conductor's track heading: "## [ ] Track: <name>" ([x] done, [~] active)
+_TRACK_HEADING_RE = re.compile(
+    r"^##\s+\[([x ~]?)\]\s+Track:\s+(.+)$", re.MULTILINE,
+)
+
+# Fields of a single tracks.md block
+_BLOCK_NAME_RE = re.compile(r"##\s+\[.\]\s+Track:\s+(.+)")
+_ID_RE = re.compile(r"\*\*ID:\*\*\s+(\S+)")
+_WAVE_RE = re.compile(r"\*\*Wave:\*\*\s+(\d+)")
+_COMPLEXITY_RE = re.compile(r"\*\*Complexity:\*\*\s+(S|M|L|XL)")
+_DEPS_RE = re.compile(r"\*\*Dependencies:\*\*\s+(.+)")
+# Comma list separator; eats the surrounding whitespace while splitting
+_DEPS_SPLIT_RE = re.compile(r"\s*,\s*")
+_FIELD_RES = {
+    "ID": _ID_RE,
+    "Wave": _WAVE_RE,
+    "Complexity": _COMPLEXITY_RE,
+    "Dependencies": _DEPS_RE,
+}
+# Zero-width, so overlapping markers are all seen
+_FIELD_MARKER_RE = re.compile(r"(?=\*\*(ID|Wave|Complexity|Dependencies):\*\*)")
+
+# ARCHITECT CONTEXT header line and the whole context block
+_CTX_HEADER_RE = re.compile(
+    r"<!-- ARCHITECT CONTEXT \| Track: (.+?) "
+    r"\| Wave: (\d+) \| CC: (.+?) -->",
+)
+_CTX_BLOCK_RE = re.compile(
+    r"(<!-- ARCHITECT CONTEXT.*?<!-- END ARCHITECT CONTEXT -->)",
+    re.DOTALL,
+)
+
+# Key Design Decisions section body and its numbered items
+_KDD_SECTION_RE = re.compile(
+    r"## Key Design Decisions\n(.*?)(?=\n## |\Z)", re.DOTALL,
+)
+_NUMBERED_ITEM_RE = re.compile(r"^\d+\.\s+", re.MULTILINE)
+
 
 class TestRunner:
-    def __init__(self, only_groups: set[str] | None = None):
+    def __init__(self, only_groups: set[str] | None = None, jobs: int = 1):
         self.results: list[TestResult] = []
         self.current_group = ""
         self._only = only_groups  # None = run all
+        self.jobs = jobs  # tracks validated concurrently
+        # Filter verdict for current_group, refreshed by group()
+        self._active = self._group_selected(self.current_group)
+        # Files are read (and JSON parsed) once per run; several
+        # validators inspect the same tracks.md / metadata.json / brief.md
+        self._text_cache: dict[Path, str] = {}
+        self._json_cache: dict[Path, object] = {}
+        self._tracks_cache: dict[Path, list[dict]] = {}
 
     def group(self, name: str):
         self.current_group = name
-
-    def _is_active(self) -> bool:
-        """Check whether the current group is included by --only filter."""
+        self._active = self._group_selected(name)
+
+    def fork(self) -> "TestRunner":
+        """A runner for one worker: same filter and file caches, own results."""
+        runner = TestRunner(self._only)
+        runner._text_cache = self._text_cache
+        runner._json_cache = self._json_cache
+        runner._tracks_cache = self._tracks_cache
+        return runner
+
+    def read_text(self, path: Path) -> str:
+        """Return a file's text, reading it only on first use."""
+        text = self._text_cache.get(path)
+        if text is None:
+            text = self._text_cache[path] = path.read_text()
+        return text
+
+    def read_json(self, path: Path):
+        """Return a file's parsed JSON; a parse error is re-raised each call."""
+        if path not in self._json_cache:
+            try:
+                self._json_cache[path] = json.loads(self.read_text(path))
+            except json.JSONDecodeError as e:
+                self._json_cache[path] = e
+        data = self._json_cache[path]
+        if isinstance(data, json.JSONDecodeError):
+            raise data
+        return data
+
+    def read_tracks(self, path: Path) -> list[dict]:
+        """Return the complete track blocks of a tracks.md, parsed once."""
+        tracks = self._tracks_cache.get(path)
+        if tracks is None:
+            tracks = self._tracks_cache[path] = _parse_track_blocks(
+                self.read_text(path))
+        return tracks
+
+    def wants(self, *aliases: str) -> bool:
+        """Check whether --only selects any of the given group aliases."""
+        return self._only is None or not self._only.isdisjoint(aliases)
+
+    def _group_selected(self, name: str) -> bool:
+        """Check whether a group is included by --only filter."""
         if self._only is None:
             return True
-        for alias, prefix in GROUP_ALIASES.items():
-            if alias in self._only and self.current_group.startswith(prefix):
+        # Only the selected aliases matter; unknown ones select nothing
+        for alias in self._only:
+            prefix = GROUP_ALIASES.get(alias)
+            if prefix is not None and name.startswith(prefix):
                 return True
         return False
 
+    def is_active(self) -> bool:
+        """Check whether the current group is included by --only filter."""
+        return self._active
+
     def check(self, name: str, condition: bool, fail_msg: str,
               severity: str = "CRITICAL", pass_msg: str = "OK") -> bool:
-        if not self._is_active():
+        """
+        Record a check result. Callers with costly failure messages pass
+        `"" if ok else f"..."` so the message is only built on failure.
+        """
+        if not self.is_active():
             return condition
         self.results.append(TestResult(
-            name=name,
-            group=self.current_group,
-            passed=condition,
-            message=pass_msg if condition else fail_msg,
-            severity=severity,
+            name, self.current_group, condition,
+            pass_msg if condition else fail_msg, severity,
         ))
         return condition
 
     def report(self) -> int:
         """Print results and return exit code (0=pass, 1=critical failures)."""
-        groups: dict[str, list[TestResult]] = {}
+        groups: defaultdict[str, list[TestResult]] = defaultdict(list)
+        failed: list[TestResult] = []
         for r in self.results:
-            groups.setdefault(r.group, []).append(r)
+            groups[r.group].append(r)
+            if not r.passed:
+                failed.append(r)
 
         total = len(self.results)
-        passed = sum(1 for r in self.results if r.passed)
-        failed = [r for r in self.results if not r.passed]
+        passed = total - len(failed)
         critical = [r for r in failed if r.severity == "CRITICAL"]
 
         print("\n" + "=" * 70)
@@ -148,6 +257,73 @@ class TestRunner:
 # Contract validators
 # -------------------------------------------------------------------
 
+def _match_track_fields(block: str) -> dict[str, re.Match]:
+    """
+    Find the ID, Wave, Complexity and Dependencies fields of a track
+    block in one scan. Each field gets the first marker whose value
+    parses, same as searching the block once per field.
+    """
+    found: dict[str, re.Match] = {}
+    for marker in _FIELD_MARKER_RE.finditer(block):
+        key = marker.group(1)
+        if key in found:
+            continue
+        m = _FIELD_RES[key].match(block, marker.start())
+        if m:
+            found[key] = m
+            if len(found) == len(_FIELD_RES):
+                break
+    return found
+
+
+def _iter_blocks(content: str, sep: str = "\n---\n"):
+    """
+    Yield the blocks of content.split(sep) one at a time, so only the
+    block being parsed is held alongside the file text.
+    """
+    start = 0
+    while (end := content.find(sep, start)) != -1:
+        yield content[start:end]
+        start = end + len(sep)
+    yield content[start:]
+
+
+def _track_entry(name_m: re.Match, fields: dict[str, re.Match]) -> dict:
+    """Build the parsed track dict from a block's matched fields."""
+    # Ids are interned so the id/dependency dict lookups in the graph
+    # checks can match on identity
+    deps_text = fields["Dependencies"].group(1).strip()
+    return {
+        "name": name_m.group(1),
+        "id": sys.intern(fields["ID"].group(1)),
+        "wave": int(fields["Wave"].group(1)),
+        "complexity": fields["Complexity"].group(1),
+        "dependencies": (
+            () if deps_text.lower() == "none"
+            else tuple(map(sys.intern, _DEPS_SPLIT_RE.split(deps_text)))
+        ),
+    }
+
+
+def _parse_track_blocks(content: str) -> list[dict]:
+    """
+    Parse every '---'-separated block of a tracks.md that has a heading
+    and all four required fields; incomplete blocks are skipped.
+    """
+    parsed = []
+    for block in _iter_blocks(content):
+        # Cheap reject before the regexes: every heading contains "Track:"
+        if "Track:" not in block:
+            continue
+        name_m = _BLOCK_NAME_RE.search(block)
+        if not name_m:
+            continue
+        fields = _match_track_fields(block)
+        if len(fields) == len(_FIELD_RES):
+            parsed.append(_track_entry(name_m, fields))
+    return parsed
+
+
 def validate_tracks_md(t: TestRunner, tracks_path: Path) -> list[dict]:
     """
     Verify tracks.md uses Conductor's expected format.
@@ -160,21 +336,27 @@ def validate_tracks_md(t: TestRunner, tracks_path: Path) -> list[dict]:
                     f"Missing: {tracks_path}"):
         return []
 
-    content = tracks_path.read_text()
+    content = t.read_text(tracks_path)
     lines = content.strip().split("\n")
 
+    # Count table rows and --- separators in one pass over the lines
+    table_count = separator_count = 0
+    for l in lines:
+        stripped = l.strip()
+        if stripped == "---":
+            separator_count += 1
+        elif stripped.startswith("|") and "|" in l[1:]:
+            table_count += 1
+
     # Must NOT be table format
-    table_lines = [l for l in lines
-                   if l.strip().startswith("|") and "|" in l[1:]]
     t.check(
         "Not table format",
-        len(table_lines) == 0,
-        f"Found {len(table_lines)} table rows -- Architect is writing "
+        table_count == 0,
+        f"Found {table_count} table rows -- Architect is writing "
         f"table format. Conductor expects ## [ ] Track: blocks.",
     )
 
     # Must have --- separators
-    separator_count = sum(1 for l in lines if l.strip() == "---")
     t.check(
         "Has --- separators",
         separator_count >= 2,
@@ -183,10 +365,7 @@ def validate_tracks_md(t: TestRunner, tracks_path: Path) -> list[dict]:
     )
 
     # Parse track blocks
-    track_pattern = re.compile(
-        r"^##\s+\[([x ~]?)\]\s+Track:\s+(.+)$", re.MULTILINE,
-    )
-    tracks = track_pattern.findall(content)
+    tracks = _TRACK_HEADING_RE.findall(content)
 
     t.check(
         "Has track headings",
@@ -196,42 +375,35 @@ def validate_tracks_md(t: TestRunner, tracks_path: Path) -> list[dict]:
     )
 
     # Each track block must have required fields
-    blocks = re.split(r"\n---\n", content)
-    track_blocks = [b for b in blocks if "## [" in b and "Track:" in b]
+    track_blocks = (
+        b for b in _iter_blocks(content) if "## [" in b and "Track:" in b
+    )
 
     parsed_tracks = []
     for block in track_blocks:
-        name_m = re.search(r"##\s+\[.\]\s+Track:\s+(.+)", block)
-        id_m = re.search(r"\*\*ID:\*\*\s+(\S+)", block)
-        wave_m = re.search(r"\*\*Wave:\*\*\s+(\d+)", block)
-        cmplx_m = re.search(r"\*\*Complexity:\*\*\s+(S|M|L|XL)", block)
-        deps_m = re.search(r"\*\*Dependencies:\*\*\s+(.+)", block)
+        name_m = _BLOCK_NAME_RE.search(block)
+        fields = _match_track_fields(block)
+        id_m = fields.get("ID")
+        wave_m = fields.get("Wave")
+        cmplx_m = fields.get("Complexity")
+        deps_m = fields.get("Dependencies")
 
         has_all = all([name_m, id_m, wave_m, cmplx_m, deps_m])
         track_name = name_m.group(1) if name_m else "unknown"
         t.check(
             f"Track '{track_name}' has all required fields",
             has_all,
+            "" if has_all else
             f"Missing fields in track block. Required: ID, Wave, "
             f"Complexity, Dependencies. "
-            f"Found: ID={'yes' if id_m else 'NO'}, "
-            f"Wave={'yes' if wave_m else 'NO'}, "
-            f"Complexity={'yes' if cmplx_m else 'NO'}, "
-            f"Deps={'yes' if deps_m else 'NO'}",
+            f"Found: ID={'yes' if 'ID' in fields else 'NO'}, "
+            f"Wave={'yes' if 'Wave' in fields else 'NO'}, "
+            f"Complexity={'yes' if 'Complexity' in fields else 'NO'}, "
+            f"Deps={'yes' if 'Dependencies' in fields else 'NO'}",
         )
 
         if has_all:
-            deps_text = deps_m.group(1).strip()
-            parsed_tracks.append({
-                "name": name_m.group(1),
-                "id": id_m.group(1),
-                "wave": int(wave_m.group(1)),
-                "complexity": cmplx_m.group(1),
-                "dependencies": (
-                    [] if deps_text.lower() == "none"
-                    else [d.strip() for d in deps_text.split(",")]
-                ),
-            })
+            parsed_tracks.append(_track_entry(name_m, fields))
 
     return parsed_tracks
 
@@ -244,13 +416,15 @@ def validate_metadata_json(t: TestRunner, metadata_path: Path,
     new, in_progress, completed, needs_patch, paused, blocked.
     """
     t.group(f"metadata.json Schema ({track_id or metadata_path.name})")
+    if not t.is_active():
+        return None
 
     if not t.check(f"metadata.json exists ({track_id})",
                     metadata_path.exists(), f"Missing: {metadata_path}"):
         return None
 
     try:
-        data = json.loads(metadata_path.read_text())
+        data = t.read_json(metadata_path)
     except json.JSONDecodeError as e:
         t.check("Valid JSON", False, f"JSON parse error: {e}")
         return None
@@ -271,29 +445,25 @@ def validate_metadata_json(t: TestRunner, metadata_path: Path,
         t.check(
             'Uses "status" field (not "state")',
             has_status,
+            "" if has_status else
             f"Missing 'status' field. Found: {list(data.keys())}",
         )
 
     # Status values
-    valid_statuses = {
-        "new", "in_progress", "completed",
-        "needs_patch", "paused", "blocked",
-    }
-    old_statuses = {"NOT_STARTED", "IN_PROGRESS", "COMPLETE", "NEEDS_PATCH"}
     status_val = data.get("status", data.get("state", ""))
 
-    if status_val in old_statuses:
+    if status_val in OLD_STATUSES:
         t.check(
             "Status value uses Conductor enum",
             False,
             f"Value '{status_val}' is Architect's old schema. "
-            f"Conductor expects one of: {sorted(valid_statuses)}",
+            f"Conductor expects one of: {_VALID_STATUSES_SORTED}",
         )
     else:
         t.check(
             "Status value uses Conductor enum",
-            status_val in valid_statuses,
-            f"Value '{status_val}' not in {sorted(valid_statuses)}",
+            status_val in VALID_STATUSES,
+            f"Value '{status_val}' not in {_VALID_STATUSES_SORTED}",
         )
 
     # Required fields
@@ -344,16 +514,20 @@ def validate_brief_md(t: TestRunner, brief_path: Path,
     header.
     """
     t.group(f"brief.md Structure ({track_id or brief_path.name})")
+    if not t.is_active():
+        return None
 
     if not t.check(f"brief.md exists ({track_id})",
                     brief_path.exists(), f"Missing: {brief_path}"):
         return None
 
-    content = brief_path.read_text()
+    content = t.read_text(brief_path)
 
-    # ARCHITECT CONTEXT header
-    has_start = "<!-- ARCHITECT CONTEXT" in content
-    has_end = "<!-- END ARCHITECT CONTEXT -->" in content
+    # ARCHITECT CONTEXT header (positions are reused to slice the block)
+    start_idx = content.find("<!-- ARCHITECT CONTEXT")
+    end_idx = content.find("<!-- END ARCHITECT CONTEXT -->")
+    has_start = start_idx != -1
+    has_end = end_idx != -1
     t.check(
         "Has ARCHITECT CONTEXT start tag",
         has_start,
@@ -368,11 +542,7 @@ def validate_brief_md(t: TestRunner, brief_path: Path,
 
     # Context header fields
     if has_start and has_end:
-        ctx_match = re.search(
-            r"<!-- ARCHITECT CONTEXT \| Track: (.+?) "
-            r"\| Wave: (\d+) \| CC: (.+?) -->",
-            content,
-        )
+        ctx_match = _CTX_HEADER_RE.search(content)
         t.check(
             "Context header has Track, Wave, CC fields",
             ctx_match is not None,
@@ -381,26 +551,24 @@ def validate_brief_md(t: TestRunner, brief_path: Path,
             "| CC: <version> -->",
         )
 
-        # Extract context block
-        start_idx = content.index("<!-- ARCHITECT CONTEXT")
-        end_idx = content.index("<!-- END ARCHITECT CONTEXT -->")
+        # Extract context block (a bare mention counts, so no need to
+        # look for the "## " heading form separately)
         ctx_block = content[start_idx:end_idx]
         t.check(
             "Context has Cross-Cutting Constraints section",
-            "## Cross-Cutting Constraints" in ctx_block
-            or "Cross-Cutting Constraints" in ctx_block,
+            "Cross-Cutting Constraints" in ctx_block,
             "Missing Cross-Cutting Constraints in context block",
             severity="IMPORTANT",
         )
         t.check(
             "Context has Interfaces section",
-            "## Interfaces" in ctx_block or "Interfaces" in ctx_block,
+            "Interfaces" in ctx_block,
             "Missing interfaces info in context block",
             severity="IMPORTANT",
         )
         t.check(
             "Context has Dependencies section",
-            "## Dependencies" in ctx_block or "Dependencies" in ctx_block,
+            "Dependencies" in ctx_block,
             "Missing dependencies info in context block",
             severity="IMPORTANT",
         )
@@ -419,17 +587,12 @@ def validate_brief_md(t: TestRunner, brief_path: Path,
         )
 
     # Key Design Decisions should have numbered items
-    kdd_match = re.search(
-        r"## Key Design Decisions\n(.*?)(?=\n## |\Z)",
-        content, re.DOTALL,
-    )
+    kdd_match = _KDD_SECTION_RE.search(content)
     if kdd_match:
-        decisions = re.findall(
-            r"^\d+\.\s+", kdd_match.group(1), re.MULTILINE,
-        )
+        # One numbered item is enough: search() stops at the first
         t.check(
             "Key Design Decisions has numbered items",
-            len(decisions) >= 1,
+            _NUMBERED_ITEM_RE.search(kdd_match.group(1)) is not None,
             "No numbered design decisions found. Brief pickup flow "
             "uses these to drive interactive spec generation.",
             severity="IMPORTANT",
@@ -459,6 +622,8 @@ def validate_brief_pickup_detection(t: TestRunner, track_dir: Path,
     Tests detection logic, not the LLM-driven flow.
     """
     t.group(f"Brief Pickup Detection ({track_id})")
+    if not t.is_active():
+        return
 
     brief_exists = (track_dir / "brief.md").exists()
     spec_exists = (track_dir / "spec.md").exists()
@@ -512,6 +677,8 @@ def validate_context_header_preservation(t: TestRunner, brief_path: Path,
     carried from brief.md into spec.md verbatim.
     """
     t.group(f"Context Header Preservation ({track_id})")
+    if not t.is_active():
+        return
 
     if not brief_path.exists():
         t.check("brief.md available for comparison", False,
@@ -522,16 +689,11 @@ def validate_context_header_preservation(t: TestRunner, brief_path: Path,
                 f"Missing: {spec_path} -- spec not yet generated")
         return
 
-    brief_content = brief_path.read_text()
-    spec_content = spec_path.read_text()
-
-    ctx_pattern = re.compile(
-        r"(<!-- ARCHITECT CONTEXT.*?<!-- END ARCHITECT CONTEXT -->)",
-        re.DOTALL,
-    )
+    brief_content = t.read_text(brief_path)
+    spec_content = t.read_text(spec_path)
 
-    brief_ctx = ctx_pattern.search(brief_content)
-    spec_ctx = ctx_pattern.search(spec_content)
+    brief_ctx = _CTX_BLOCK_RE.search(brief_content)
+    spec_ctx = _CTX_BLOCK_RE.search(spec_content)
 
     t.check(
         "spec.md has ARCHITECT CONTEXT block",
@@ -541,25 +703,75 @@ def validate_context_header_preservation(t: TestRunner, brief_path: Path,
     )
 
     if brief_ctx and spec_ctx:
-        # Normalize whitespace for comparison
-        brief_block = " ".join(brief_ctx.group(1).split())
-        spec_block = " ".join(spec_ctx.group(1).split())
+        # Compare ignoring whitespace differences: equal token lists are
+        # equal once re-joined, so skip building the joined strings
         t.check(
             "Context block matches brief.md verbatim",
-            brief_block == spec_block,
+            brief_ctx.group(1).split() == spec_ctx.group(1).split(),
             "ARCHITECT CONTEXT in spec.md differs from brief.md. "
             "The header must be copied verbatim.",
             severity="IMPORTANT",
         )
 
 
+def _track_dirs(tracks_dir: Path, skip_hidden: bool = False) -> list[Path]:
+    """
+    Track directories under tracks_dir, sorted by name. scandir entries
+    carry their file type, so this costs no stat per directory.
+    """
+    with os.scandir(tracks_dir) as entries:
+        names = sorted(
+            e.name for e in entries
+            if e.is_dir() and not (skip_hidden and e.name.startswith("."))
+        )
+    return [tracks_dir / name for name in names]
+
+
+def _scan_tracks(t: TestRunner, tracks_dir: Path) -> dict[str, dict]:
+    """
+    List the track directories once, sorted by name, with the files
+    each one contains and its parsed metadata.json (None when missing or
+    invalid). Shared by the validators that walk every track.
+    """
+    catalog: dict[str, dict] = {}
+    for track_dir in _track_dirs(tracks_dir, skip_hidden=True):
+        name = track_dir.name
+        with os.scandir(track_dir) as entries:
+            files = {e.name for e in entries}
+
+        meta_path = track_dir / "metadata.json"
+        has_meta = "metadata.json" in files
+        meta = None
+        if has_meta:
+            try:
+                meta = t.read_json(meta_path)
+            except json.JSONDecodeError:
+                pass
+            except FileNotFoundError:  # dangling symlink
+                has_meta = False
+
+        catalog[name] = {
+            "dir": track_dir,
+            "has_meta": has_meta,
+            "meta": meta,
+            "has_brief": "brief.md" in files,
+            "has_spec": "spec.md" in files,
+            "has_plan": "plan.md" in files,
+        }
+    return catalog
+
+
 def validate_cross_references(t: TestRunner, conductor_dir: Path,
-                              parsed_tracks: list[dict]):
+                              parsed_tracks: list[dict],
+                              catalog: dict[str, dict] | None = None):
     """
     Verify consistency between tracks.md, directory structure,
-    and metadata files.
+    and metadata files. catalog is an optional _scan_tracks() result
+    for conductor_dir / "tracks".
     """
     t.group("Cross-References (tracks.md <-> filesystem <-> metadata)")
+    if not t.is_active():
+        return
 
     tracks_dir = conductor_dir / "tracks"
     if not tracks_dir.exists():
@@ -567,61 +779,86 @@ def validate_cross_references(t: TestRunner, conductor_dir: Path,
                 f"Missing: {tracks_dir}")
         return
 
-    # Get all track directories
-    fs_track_ids = sorted([
-        d.name for d in tracks_dir.iterdir()
-        if d.is_dir() and not d.name.startswith(".")
-    ])
+    if catalog is None:
+        catalog = _scan_tracks(t, tracks_dir)
 
-    # Get track IDs from parsed tracks.md
-    md_track_ids = sorted([trk["id"] for trk in parsed_tracks])
+    # Track directories (catalog keys) vs track IDs from tracks.md;
+    # the sorted listings are only needed for the failure message
+    fs_ids = catalog.keys()
+    md_ids = {trk["id"] for trk in parsed_tracks}
 
+    listed = md_ids == fs_ids
     t.check(
         "tracks.md lists all track directories",
-        set(md_track_ids) == set(fs_track_ids),
-        f"Mismatch -- tracks.md has {md_track_ids}, "
-        f"filesystem has {fs_track_ids}. "
-        f"Missing from tracks.md: "
-        f"{sorted(set(fs_track_ids) - set(md_track_ids))}. "
-        f"Missing from filesystem: "
-        f"{sorted(set(md_track_ids) - set(fs_track_ids))}.",
+        listed,
+        "" if listed else
+        f"Mismatch -- tracks.md has "
+        f"{sorted([trk['id'] for trk in parsed_tracks])}, "
+        f"filesystem has {list(fs_ids)}. "
+        f"Missing from tracks.md: {sorted(fs_ids - md_ids)}. "
+        f"Missing from filesystem: {sorted(md_ids - fs_ids)}.",
     )
 
     # Each track directory has metadata.json
-    for track_id in fs_track_ids:
-        track_dir = tracks_dir / track_id
+    for track_id, track in catalog.items():
         t.check(
             f"Track {track_id} has metadata.json",
-            (track_dir / "metadata.json").exists(),
-            f"Missing metadata.json in {track_dir}",
+            track["has_meta"],
+            f"Missing metadata.json in {track['dir']}",
         )
 
         # metadata.json track_id matches directory name
-        meta_path = track_dir / "metadata.json"
-        if meta_path.exists():
-            try:
-                meta = json.loads(meta_path.read_text())
-                t.check(
-                    f"Track {track_id} metadata.track_id matches directory",
-                    meta.get("track_id") == track_id,
-                    f"metadata.track_id='{meta.get('track_id')}' "
-                    f"but directory is '{track_id}'",
-                    severity="IMPORTANT",
-                )
-            except json.JSONDecodeError:
-                pass
+        meta = track["meta"]
+        if meta is not None:
+            t.check(
+                f"Track {track_id} metadata.track_id matches directory",
+                meta.get("track_id") == track_id,
+                f"metadata.track_id='{meta.get('track_id')}' "
+                f"but directory is '{track_id}'",
+                severity="IMPORTANT",
+            )
 
         # Track has either brief.md or spec.md
-        has_brief = (track_dir / "brief.md").exists()
-        has_spec = (track_dir / "spec.md").exists()
         t.check(
             f"Track {track_id} has brief.md or spec.md",
-            has_brief or has_spec,
+            track["has_brief"] or track["has_spec"],
             "Track directory has neither brief.md nor spec.md "
             "-- cannot implement",
         )
 
 
+def _has_cycle(deps_by_id: dict[str, tuple[str, ...]]) -> bool:
+    """
+    Detect a dependency cycle with an iterative DFS, so deep graphs
+    cannot hit the recursion limit. Stops at the first back edge.
+    Dependencies on unknown tracks are leaves.
+    """
+    state: dict[str, int] = {}  # 1 = on the current path, 2 = finished
+    for root, root_deps in deps_by_id.items():
+        if root in state:
+            continue
+        state[root] = 1
+        stack = [(root, iter(root_deps))]
+        while stack:
+            node, deps = stack[-1]
+            for dep in deps:
+                dep_state = state.get(dep)
+                if dep_state == 1:
+                    return True
+                if dep_state is None:
+                    dep_deps = deps_by_id.get(dep)
+                    if dep_deps is None:
+                        state[dep] = 2
+                        continue
+                    state[dep] = 1
+                    stack.append((dep, iter(dep_deps)))
+                    break
+            else:
+                state[node] = 2
+                stack.pop()
+    return False
+
+
 def validate_dependency_graph(t: TestRunner, parsed_tracks: list[dict]):
     """
     Verify dependency graph is valid: no cycles, no forward-wave
@@ -634,104 +871,88 @@ def validate_dependency_graph(t: TestRunner, parsed_tracks: list[dict]):
                 "No parsed tracks -- skipping dependency validation")
         return
 
-    track_by_id = {trk["id"]: trk for trk in parsed_tracks}
-    all_ids = set(track_by_id.keys())
+    # Every check below is dropped when --only excludes this group, and
+    # building the graph has no other effect
+    if not t.is_active():
+        return
+
+    # Only ids, waves and dependencies matter here; project them into
+    # flat id -> value maps (later duplicates win, as before)
+    wave_by_id = {trk["id"]: trk["wave"] for trk in parsed_tracks}
+    deps_by_id = {trk["id"]: trk["dependencies"] for trk in parsed_tracks}
 
-    # All dependencies reference existing tracks
+    # All dependencies reference existing tracks. Failure messages are
+    # only formatted for failing checks.
     for trk in parsed_tracks:
+        trk_id = trk["id"]
         for dep in trk["dependencies"]:
+            exists = dep in wave_by_id
             t.check(
-                f"Dependency '{dep}' exists "
-                f"(referenced by {trk['id']})",
-                dep in all_ids,
-                f"Track {trk['id']} depends on '{dep}' "
-                f"which is not in tracks.md",
+                f"Dependency '{dep}' exists (referenced by {trk_id})",
+                exists,
+                "" if exists else
+                f"Track {trk_id} depends on '{dep}' which is not in tracks.md",
             )
 
     # No track depends on a same-or-later wave
     for trk in parsed_tracks:
+        trk_id, wave = trk["id"], trk["wave"]
         for dep_id in trk["dependencies"]:
-            if dep_id in track_by_id:
-                dep_wave = track_by_id[dep_id]["wave"]
+            dep_wave = wave_by_id.get(dep_id)
+            if dep_wave is not None:
+                ordered = dep_wave < wave
                 t.check(
-                    f"{trk['id']} (wave {trk['wave']}) -> "
-                    f"{dep_id} (wave {dep_wave})",
-                    dep_wave < trk["wave"],
-                    f"Track {trk['id']} (wave {trk['wave']}) depends "
-                    f"on {dep_id} (wave {dep_wave}). Dependencies "
-                    f"must be in earlier waves.",
+                    f"{trk_id} (wave {wave}) -> {dep_id} (wave {dep_wave})",
+                    ordered,
+                    "" if ordered else
+                    f"Track {trk_id} (wave {wave}) depends on {dep_id} "
+                    f"(wave {dep_wave}). Dependencies must be in earlier "
+                    f"waves.",
                 )
 
-    # Cycle detection (DFS with recursion stack)
-    visited: set[str] = set()
-    rec_stack: set[str] = set()
-    has_cycle = False
-
-    def dfs(track_id: str):
-        nonlocal has_cycle
-        visited.add(track_id)
-        rec_stack.add(track_id)
-        trk = track_by_id.get(track_id)
-        if trk:
-            for dep in trk["dependencies"]:
-                if dep not in visited:
-                    dfs(dep)
-                elif dep in rec_stack:
-                    has_cycle = True
-        rec_stack.discard(track_id)
-
-    for tid in all_ids:
-        if tid not in visited:
-            dfs(tid)
-
     t.check(
         "Dependency graph is acyclic",
-        not has_cycle,
+        not _has_cycle(deps_by_id),
         "Circular dependency detected in track graph",
     )
 
 
-def validate_state_machine(t: TestRunner, conductor_dir: Path):
+def validate_state_machine(t: TestRunner, conductor_dir: Path,
+                           catalog: dict[str, dict] | None = None):
     """
     Verify all tracks are in valid states and state transitions
-    are consistent.
+    are consistent. catalog is an optional _scan_tracks() result
+    for conductor_dir / "tracks".
     """
     t.group("State Machine Validity")
+    if not t.is_active():
+        return
 
     tracks_dir = conductor_dir / "tracks"
     if not tracks_dir.exists():
         return
 
-    valid_statuses = {
-        "new", "in_progress", "completed",
-        "needs_patch", "paused", "blocked",
-    }
+    if catalog is None:
+        catalog = _scan_tracks(t, tracks_dir)
 
-    for track_dir in sorted(tracks_dir.iterdir()):
-        if not track_dir.is_dir() or track_dir.name.startswith("."):
+    for track_id, track in catalog.items():
+        # Skip tracks whose metadata.json is missing or invalid JSON
+        meta = track["meta"]
+        if meta is None:
             continue
 
-        meta_path = track_dir / "metadata.json"
-        if not meta_path.exists():
-            continue
-
-        try:
-            meta = json.loads(meta_path.read_text())
-        except json.JSONDecodeError:
-            continue
-
-        track_id = track_dir.name
         status = meta.get("status", meta.get("state", "UNKNOWN"))
 
+        ok = status in VALID_STATUSES
         t.check(
             f"Track {track_id} status is valid",
-            status in valid_statuses,
-            f"Status '{status}' not in {sorted(valid_statuses)}",
+            ok,
+            "" if ok else f"Status '{status}' not in {_VALID_STATUSES_SORTED}",
         )
 
         # State consistency with files
-        has_spec = (track_dir / "spec.md").exists()
-        has_plan = (track_dir / "plan.md").exists()
+        has_spec = track["has_spec"]
+        has_plan = track["has_plan"]
         started = meta.get("started_at") is not None
         completed = meta.get("completed_at") is not None
 
@@ -767,21 +988,18 @@ def validate_state_machine(t: TestRunner, conductor_dir: Path):
 def validate_negative_tracks_table(t: TestRunner, path: Path):
     """Tracks in table format must be detected as wrong."""
     t.group("Negative Tests (detect bad output)")
-    content = path.read_text()
+    if not t.is_active():
+        return
+    content = t.read_text(path)
     lines = content.strip().split("\n")
-    table_lines = [l for l in lines
-                   if l.strip().startswith("|") and "|" in l[1:]]
     t.check(
         "Detects table format as invalid",
-        len(table_lines) > 0,
+        any(l.strip().startswith("|") and "|" in l[1:] for l in lines),
         "Expected table rows to prove detector works",
     )
-    track_pattern = re.compile(
-        r"^##\s+\[([x ~]?)\]\s+Track:\s+(.+)$", re.MULTILINE,
-    )
     t.check(
         "No ## [ ] Track: headings in table format",
-        len(track_pattern.findall(content)) == 0,
+        len(_TRACK_HEADING_RE.findall(content)) == 0,
         "Table format should not have ## [ ] Track: headings",
     )
 
@@ -789,7 +1007,9 @@ def validate_negative_tracks_table(t: TestRunner, path: Path):
 def validate_negative_metadata_old(t: TestRunner, path: Path):
     """Old metadata schema (state/NOT_STARTED) must be detected."""
     t.group("Negative Tests (detect bad output)")
-    data = json.loads(path.read_text())
+    if not t.is_active():
+        return
+    data = t.read_json(path)
     t.check(
         "Detects 'state' field (old schema)",
         "state" in data,
@@ -805,7 +1025,9 @@ def validate_negative_metadata_old(t: TestRunner, path: Path):
 def validate_negative_brief_no_header(t: TestRunner, path: Path):
     """Brief without ARCHITECT CONTEXT must be detected."""
     t.group("Negative Tests (detect bad output)")
-    content = path.read_text()
+    if not t.is_active():
+        return
+    content = t.read_text(path)
     t.check(
         "Detects missing ARCHITECT CONTEXT",
         "<!-- ARCHITECT CONTEXT" not in content,
@@ -816,17 +1038,15 @@ def validate_negative_brief_no_header(t: TestRunner, path: Path):
 def validate_negative_brief_malformed(t: TestRunner, path: Path):
     """Brief with malformed ARCHITECT CONTEXT must be detected."""
     t.group("Negative Tests (detect bad output)")
-    content = path.read_text()
+    if not t.is_active():
+        return
+    content = t.read_text(path)
     t.check(
         "Has ARCHITECT CONTEXT tags (malformed)",
         "<!-- ARCHITECT CONTEXT" in content,
         "Expected context tags to exist",
     )
-    ctx_match = re.search(
-        r"<!-- ARCHITECT CONTEXT \| Track: (.+?) "
-        r"\| Wave: (\d+) \| CC: (.+?) -->",
-        content,
-    )
+    ctx_match = _CTX_HEADER_RE.search(content)
     t.check(
         "Detects malformed context header (no Track|Wave|CC)",
         ctx_match is None,
@@ -839,7 +1059,9 @@ def validate_negative_spec_lost_context(t: TestRunner,
                                         spec_path: Path):
     """Spec without context header (lost during generation)."""
     t.group("Negative Tests (detect bad output)")
-    spec_content = spec_path.read_text()
+    if not t.is_active():
+        return
+    spec_content = t.read_text(spec_path)
     t.check(
         "Detects spec without ARCHITECT CONTEXT",
         "<!-- ARCHITECT CONTEXT" not in spec_content,
@@ -850,54 +1072,15 @@ def validate_negative_spec_lost_context(t: TestRunner,
 def validate_negative_cycle(t: TestRunner, tracks_path: Path):
     """Dependency cycle must be detected."""
     t.group("Negative Tests (dependency cycle)")
-    parsed = []
-    content = tracks_path.read_text()
-    blocks = re.split(r"\n---\n", content)
-    for block in blocks:
-        name_m = re.search(r"##\s+\[.\]\s+Track:\s+(.+)", block)
-        id_m = re.search(r"\*\*ID:\*\*\s+(\S+)", block)
-        wave_m = re.search(r"\*\*Wave:\*\*\s+(\d+)", block)
-        cmplx_m = re.search(r"\*\*Complexity:\*\*\s+(S|M|L|XL)", block)
-        deps_m = re.search(r"\*\*Dependencies:\*\*\s+(.+)", block)
-        if all([name_m, id_m, wave_m, cmplx_m, deps_m]):
-            deps_text = deps_m.group(1).strip()
-            parsed.append({
-                "name": name_m.group(1),
-                "id": id_m.group(1),
-                "wave": int(wave_m.group(1)),
-                "complexity": cmplx_m.group(1),
-                "dependencies": (
-                    [] if deps_text.lower() == "none"
-                    else [d.strip() for d in deps_text.split(",")]
-                ),
-            })
+    if not t.is_active():
+        return
+    parsed = t.read_tracks(tracks_path)
 
     # Run cycle detection
-    track_by_id = {trk["id"]: trk for trk in parsed}
-    visited: set[str] = set()
-    rec_stack: set[str] = set()
-    has_cycle = False
-
-    def dfs(tid: str):
-        nonlocal has_cycle
-        visited.add(tid)
-        rec_stack.add(tid)
-        trk = track_by_id.get(tid)
-        if trk:
-            for dep in trk["dependencies"]:
-                if dep not in visited:
-                    dfs(dep)
-                elif dep in rec_stack:
-                    has_cycle = True
-        rec_stack.discard(tid)
-
-    for tid in track_by_id:
-        if tid not in visited:
-            dfs(tid)
-
+    deps_by_id = {trk["id"]: trk["dependencies"] for trk in parsed}
     t.check(
         "Cycle detected in bad fixture",
-        has_cycle,
+        _has_cycle(deps_by_id),
         "Expected cycle to be detected in cycle fixture",
     )
 
@@ -905,34 +1088,16 @@ def validate_negative_cycle(t: TestRunner, tracks_path: Path):
 def validate_negative_forward_wave(t: TestRunner, tracks_path: Path):
     """Forward-wave dependency must be detected."""
     t.group("Negative Tests (forward-wave dependency)")
-    parsed = []
-    content = tracks_path.read_text()
-    blocks = re.split(r"\n---\n", content)
-    for block in blocks:
-        name_m = re.search(r"##\s+\[.\]\s+Track:\s+(.+)", block)
-        id_m = re.search(r"\*\*ID:\*\*\s+(\S+)", block)
-        wave_m = re.search(r"\*\*Wave:\*\*\s+(\d+)", block)
-        cmplx_m = re.search(r"\*\*Complexity:\*\*\s+(S|M|L|XL)", block)
-        deps_m = re.search(r"\*\*Dependencies:\*\*\s+(.+)", block)
-        if all([name_m, id_m, wave_m, cmplx_m, deps_m]):
-            deps_text = deps_m.group(1).strip()
-            parsed.append({
-                "name": name_m.group(1),
-                "id": id_m.group(1),
-                "wave": int(wave_m.group(1)),
-                "complexity": cmplx_m.group(1),
-                "dependencies": (
-                    [] if deps_text.lower() == "none"
-                    else [d.strip() for d in deps_text.split(",")]
-                ),
-            })
-
-    track_by_id = {trk["id"]: trk for trk in parsed}
-    found_forward = False
-    for trk in parsed:
-        for dep_id in trk["dependencies"]:
-            if dep_id in track_by_id and track_by_id[dep_id]["wave"] >= trk["wave"]:
-                found_forward = True
+    if not t.is_active():
+        return
+    parsed = t.read_tracks(tracks_path)
+
+    # Stops at the first dependency on a same-or-later wave
+    wave_by_id = {trk["id"]: trk["wave"] for trk in parsed}
+    found_forward = any(
+        dep_id in wave_by_id and wave_by_id[dep_id] >= trk["wave"]
+        for trk in parsed for dep_id in trk["dependencies"]
+    )
 
     t.check(
         "Forward-wave dependency detected in bad fixture",
@@ -945,6 +1110,29 @@ def validate_negative_forward_wave(t: TestRunner, tracks_path: Path):
 # Test scenarios
 # -------------------------------------------------------------------
 
+def _validate_tracks(t: TestRunner, track_dirs: list[Path],
+                     check_track: Callable[[TestRunner, Path], None]):
+    """
+    Run check_track for every track directory. With t.jobs > 1 the
+    tracks are validated concurrently (the work is mostly file reads);
+    each worker records into a fork of t and the results are merged
+    back in track order, so the report is the same as a serial run.
+    """
+    if t.jobs <= 1 or len(track_dirs) <= 1:
+        for track_dir in track_dirs:
+            check_track(t, track_dir)
+        return
+
+    def work(track_dir: Path) -> TestRunner:
+        runner = t.fork()
+        check_track(runner, track_dir)
+        return runner
+
+    with ThreadPoolExecutor(max_workers=t.jobs) as executor:
+        for runner in executor.map(work, track_dirs):
+            t.results.extend(runner.results)
+
+
 def run_fixture_tests(t: TestRunner, fixtures_dir: Path):
     """Run tests against fixture files."""
 
@@ -955,49 +1143,51 @@ def run_fixture_tests(t: TestRunner, fixtures_dir: Path):
 
         tracks_dir = arch_dir / "tracks"
         if tracks_dir.exists():
-            for track_dir in sorted(tracks_dir.iterdir()):
-                if not track_dir.is_dir():
-                    continue
+            def check_output_track(t: TestRunner, track_dir: Path):
                 tid = track_dir.name
                 validate_metadata_json(t, track_dir / "metadata.json", tid)
                 validate_brief_md(t, track_dir / "brief.md", tid)
                 validate_brief_pickup_detection(t, track_dir, tid)
 
+            _validate_tracks(t, _track_dirs(tracks_dir), check_output_track)
+
         if parsed:
+            catalog = (_scan_tracks(t, tracks_dir)
+                       if tracks_dir.exists() and t.wants("xref", "state")
+                       else None)
             validate_dependency_graph(t, parsed)
-            validate_cross_references(t, arch_dir, parsed)
-            validate_state_machine(t, arch_dir)
+            validate_cross_references(t, arch_dir, parsed, catalog)
+            validate_state_machine(t, arch_dir, catalog)
 
     # -- Scenario 2: Manual track (regression) -----------------
     manual_dir = fixtures_dir / "conductor-manual"
     if manual_dir.exists():
         tracks_dir = manual_dir / "tracks"
         if tracks_dir.exists():
-            for track_dir in sorted(tracks_dir.iterdir()):
-                if not track_dir.is_dir():
-                    continue
+            def check_manual_track(t: TestRunner, track_dir: Path):
                 tid = track_dir.name
                 validate_metadata_json(
                     t, track_dir / "metadata.json", tid,
                 )
                 validate_brief_pickup_detection(t, track_dir, tid)
 
+            _validate_tracks(t, _track_dirs(tracks_dir), check_manual_track)
+
     # -- Scenario 3: Post spec-gen (context preservation) ------
     post_dir = fixtures_dir / "post-spec-gen"
     if post_dir.exists():
         tracks_dir = post_dir / "tracks"
         if tracks_dir.exists():
-            for track_dir in sorted(tracks_dir.iterdir()):
-                if not track_dir.is_dir():
-                    continue
-                tid = track_dir.name
+            def check_post_spec_track(t: TestRunner, track_dir: Path):
                 validate_context_header_preservation(
                     t,
                     track_dir / "brief.md",
                     track_dir / "spec.md",
-                    tid,
+                    track_dir.name,
                 )
 
+            _validate_tracks(t, _track_dirs(tracks_dir), check_post_spec_track)
+
     # -- Scenario 4: Negative cases (bad fixtures) -------------
     bad_dir = fixtures_dir / "bad"
     if bad_dir.exists():
@@ -1044,30 +1234,37 @@ def run_project_tests(t: TestRunner, conductor_dir: Path):
     parsed = validate_tracks_md(t, conductor_dir / "tracks.md")
 
     tracks_dir = conductor_dir / "tracks"
-    if tracks_dir.exists():
-        for track_dir in sorted(tracks_dir.iterdir()):
-            if not track_dir.is_dir() or track_dir.name.startswith("."):
-                continue
-            tid = track_dir.name
-            validate_metadata_json(t, track_dir / "metadata.json", tid)
 
-            if (track_dir / "brief.md").exists():
-                validate_brief_md(t, track_dir / "brief.md", tid)
+    def check_track(t: TestRunner, track_dir: Path):
+        tid = track_dir.name
+        validate_metadata_json(t, track_dir / "metadata.json", tid)
 
-            validate_brief_pickup_detection(t, track_dir, tid)
+        if (track_dir / "brief.md").exists():
+            validate_brief_md(t, track_dir / "brief.md", tid)
 
-            if ((track_dir / "brief.md").exists()
-                    and (track_dir / "spec.md").exists()):
-                validate_context_header_preservation(
-                    t, track_dir / "brief.md",
-                    track_dir / "spec.md", tid,
-                )
+        validate_brief_pickup_detection(t, track_dir, tid)
+
+        if ((track_dir / "brief.md").exists()
+                and (track_dir / "spec.md").exists()):
+            validate_context_header_preservation(
+                t, track_dir / "brief.md",
+                track_dir / "spec.md", tid,
+            )
+
+    if tracks_dir.exists():
+        _validate_tracks(
+            t, _track_dirs(tracks_dir, skip_hidden=True), check_track,
+        )
+
+    # One listing of tracks/ serves both whole-project validators
+    catalog = (_scan_tracks(t, tracks_dir)
+               if tracks_dir.exists() and t.wants("xref", "state") else None)
 
     if parsed:
         validate_dependency_graph(t, parsed)
-        validate_cross_references(t, conductor_dir, parsed)
+        validate_cross_references(t, conductor_dir, parsed, catalog)
 
-    validate_state_machine(t, conductor_dir)
+    validate_state_machine(t, conductor_dir, catalog)
 
 
 # -------------------------------------------------------------------
@@ -1096,10 +1293,14 @@ def main():
         help="Comma-separated test groups: "
              "tracks,metadata,brief,pickup,context,xref,deps,state,negative",
     )
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Tracks to validate concurrently (default: 1, no pool)",
+    )
     args = parser.parse_args()
 
     only = set(args.only.split(",")) if args.only else None
-    t = TestRunner(only_groups=only)
+    t = TestRunner(only_groups=only, jobs=args.jobs)
 
     if args.fixtures:
         run_fixture_tests(t, args.fixtures)
@@ -9,27 +9,43 @@ Uses unittest (stdlib-only). Run with:
     python -m unittest tests/test_enhanced_testing.py -v
 """
 
+import io
 import json
+import os
+import shlex
+import signal
 import subprocess
 import sys
 import tempfile
+import time
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
+from unittest import mock
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT / "scripts"))
 
 import validate_wave_completion as vwc
 
+
+def _load_json(path: Path):
+    """Parse a JSON file from one binary read (json.loads accepts bytes)."""
+    with path.open("rb") as f:
+        return json.loads(f.read())
+
+
 # --- Test Brief Template ---
 
 
 class TestBriefTemplateTestStrategy(unittest.TestCase):
     """Verify track-brief.md template includes Test Strategy section."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # Read once for the class; the tests only inspect it
         template_path = REPO_ROOT / "skills" / "architect" / "templates" / "track-brief.md"
-        self.template = template_path.read_text()
+        cls.template = template_path.read_text()
 
     def test_has_test_strategy_section(self):
         self.assertIn("## Test Strategy", self.template)
@@ -63,9 +79,10 @@ class TestBriefTemplateTestStrategy(unittest.TestCase):
 class TestMetadataTemplate(unittest.TestCase):
     """Verify track-metadata.json template includes new T-TEST fields."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         template_path = REPO_ROOT / "skills" / "architect" / "templates" / "track-metadata.json"
-        self.meta = json.loads(template_path.read_text())
+        cls.meta = json.loads(template_path.read_text())
 
     def test_has_test_prerequisites(self):
         self.assertIn("test_prerequisites", self.meta)
@@ -167,6 +184,20 @@ class TestCheckTestPrerequisites(unittest.TestCase):
             self.assertIn("02_db (new)", msg)
             self.assertNotIn("01_infra", msg)  # completed one shouldn't appear in failure
 
+    def test_prerequisites_with_shared_listing(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            d1 = Path(tmpdir) / "01_infra"
+            d1.mkdir()
+            (d1 / "metadata.json").write_text(
+                json.dumps({"track_id": "01_infra", "status": "completed"})
+            )
+            track_dirs = vwc.list_track_dirs(tmpdir)
+            meta = {"test_prerequisites": ["01_infra", "99_nonexistent"]}
+            ok, msg = vwc.check_test_prerequisites(meta, tmpdir, track_dirs)
+            self.assertFalse(ok)
+            self.assertIn("99_nonexistent (not found)", msg)
+            self.assertNotIn("01_infra", msg)
+
 
 # --- Quality Threshold ---
 
@@ -216,7 +247,7 @@ class TestLogOverride(unittest.TestCase):
 
             vwc.log_override(meta, meta_path, "tests", "Flaky test — known issue #42")
 
-            saved = json.loads(meta_path.read_text())
+            saved = _load_json(meta_path)
             self.assertEqual(len(saved["override_log"]), 1)
             entry = saved["override_log"][0]
             self.assertEqual(entry["check"], "tests")
@@ -232,7 +263,7 @@ class TestLogOverride(unittest.TestCase):
 
             vwc.log_override(meta, meta_path, "tests", "Second override")
 
-            saved = json.loads(meta_path.read_text())
+            saved = _load_json(meta_path)
             self.assertEqual(len(saved["override_log"]), 2)
             self.assertEqual(saved["override_log"][0]["check"], "phases")
             self.assertEqual(saved["override_log"][1]["check"], "tests")
@@ -245,7 +276,7 @@ class TestLogOverride(unittest.TestCase):
 
             vwc.log_override(meta, meta_path, "discoveries", "Deferred to next sprint")
 
-            saved = json.loads(meta_path.read_text())
+            saved = _load_json(meta_path)
             self.assertIn("override_log", saved)
             self.assertEqual(len(saved["override_log"]), 1)
 
@@ -257,7 +288,7 @@ class TestLogOverride(unittest.TestCase):
 
             vwc.log_override(meta, meta_path, "tests", "reason")
 
-            saved = json.loads(meta_path.read_text())
+            saved = _load_json(meta_path)
             ts = saved["override_log"][0]["timestamp"]
             # ISO 8601 format check
             self.assertRegex(ts, r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
@@ -269,9 +300,10 @@ class TestLogOverride(unittest.TestCase):
 class TestBriefGeneratorAgent(unittest.TestCase):
     """Verify brief-generator.md agent includes T-TEST instructions."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         agent_path = REPO_ROOT / "agents" / "brief-generator.md"
-        self.content = agent_path.read_text()
+        cls.content = agent_path.read_text()
 
     def test_mentions_test_strategy(self):
         self.assertIn("Test Strategy", self.content)
@@ -299,6 +331,13 @@ class TestBriefGeneratorAgent(unittest.TestCase):
 class TestWaveValidationIntegration(unittest.TestCase):
     """Integration tests for the full wave validation with T-TEST fields."""
 
+    def setUp(self):
+        # A fresh tracks directory per test: tests edit statuses, test
+        # commands and marker files, so none may see another's tracks
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmpdir = tmp.name
+
     def _create_track(self, tmpdir, track_id, wave, status="completed",
                       prereqs=None, quality=None, plan_complete=True):
         """Helper to create a track directory with metadata and plan."""
@@ -314,7 +353,7 @@ class TestWaveValidationIntegration(unittest.TestCase):
             "override_log": [],
             "patches": [],
         }
-        (track_dir / "metadata.json").write_text(json.dumps(meta, indent=2))
+        (track_dir / "metadata.json").write_text(json.dumps(meta, separators=(",", ":")))
 
         if plan_complete:
             (track_dir / "plan.md").write_text("- [x] Task 1\n- [x] Task 2\n")
@@ -323,60 +362,201 @@ class TestWaveValidationIntegration(unittest.TestCase):
 
         return track_dir
 
+    def _run_cli(self, *argv):
+        """Run the validator's main() in-process; return (exit code, stdout)."""
+        out = io.StringIO()
+        with redirect_stdout(out), \
+                mock.patch.object(sys, "argv", ["validate_wave_completion.py", *argv]):
+            try:
+                vwc.main()
+            except SystemExit as e:
+                return e.code, out.getvalue()
+        return 0, out.getvalue()
+
     def test_cli_with_prerequisites_pass(self):
         """Full CLI run where prerequisites are met."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create prerequisite track (completed)
-            self._create_track(tmpdir, "01_infra", wave=1, status="completed")
-            # Create wave 2 track with prerequisite on 01_infra
-            self._create_track(tmpdir, "03_api", wave=2, prereqs=["01_infra"])
-
-            result = subprocess.run(
-                [sys.executable, str(REPO_ROOT / "scripts" / "validate_wave_completion.py"),
-                 "--wave", "2", "--tracks-dir", tmpdir, "--skip-tests"],
-                capture_output=True, text=True,
-            )
-            self.assertEqual(result.returncode, 0)
-            output = json.loads(result.stdout)
-            self.assertTrue(output["passed"])
+        tmpdir = self.tmpdir
+        # Create prerequisite track (completed)
+        self._create_track(tmpdir, "01_infra", wave=1, status="completed")
+        # Create wave 2 track with prerequisite on 01_infra
+        self._create_track(tmpdir, "03_api", wave=2, prereqs=["01_infra"])
+
+        returncode, stdout = self._run_cli("--wave", "2", "--tracks-dir", tmpdir, "--skip-tests")
+        self.assertEqual(returncode, 0)
+        output = json.loads(stdout)
+        self.assertTrue(output["passed"])
 
     def test_cli_with_prerequisites_fail(self):
         """Full CLI run where prerequisites are NOT met."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create prerequisite track (still in progress)
-            self._create_track(tmpdir, "01_infra", wave=1, status="in_progress")
-            # Create wave 2 track with prerequisite on 01_infra
-            self._create_track(tmpdir, "03_api", wave=2, prereqs=["01_infra"])
-
-            result = subprocess.run(
-                [sys.executable, str(REPO_ROOT / "scripts" / "validate_wave_completion.py"),
-                 "--wave", "2", "--tracks-dir", tmpdir, "--skip-tests"],
-                capture_output=True, text=True,
-            )
-            self.assertEqual(result.returncode, 1)
-            output = json.loads(result.stdout)
-            self.assertFalse(output["passed"])
-            # Find the prerequisite failure
-            prereq_results = [r for r in output["results"] if r.get("check") == "prerequisites"]
-            self.assertTrue(len(prereq_results) > 0)
-            self.assertEqual(prereq_results[0]["status"], "FAIL")
+        tmpdir = self.tmpdir
+        # Create prerequisite track (still in progress)
+        self._create_track(tmpdir, "01_infra", wave=1, status="in_progress")
+        # Create wave 2 track with prerequisite on 01_infra
+        self._create_track(tmpdir, "03_api", wave=2, prereqs=["01_infra"])
+
+        returncode, stdout = self._run_cli("--wave", "2", "--tracks-dir", tmpdir, "--skip-tests")
+        self.assertEqual(returncode, 1)
+        output = json.loads(stdout)
+        self.assertFalse(output["passed"])
+        # Find the prerequisite failure
+        prereq_results = [r for r in output["results"] if r.get("check") == "prerequisites"]
+        self.assertTrue(len(prereq_results) > 0)
+        self.assertEqual(prereq_results[0]["status"], "FAIL")
+
+    def test_cli_skips_tests_when_prerequisites_fail(self):
+        """Tests are not run for a track that has already failed."""
+        tmpdir = self.tmpdir
+        self._create_track(tmpdir, "01_infra", wave=1, status="in_progress")
+        track_dir = self._create_track(tmpdir, "03_api", wave=2, prereqs=["01_infra"])
+        marker = Path(tmpdir) / "tests_ran"
+        meta_path = track_dir / "metadata.json"
+        meta = json.loads(meta_path.read_text())
+        meta["test_command"] = f'{sys.executable} -c "open({str(marker)!r}, \'w\')"'
+        meta_path.write_text(json.dumps(meta, separators=(",", ":")))
+
+        returncode, stdout = self._run_cli("--wave", "2", "--tracks-dir", tmpdir)
+        self.assertEqual(returncode, 1)
+        self.assertFalse(marker.exists())
+        output = json.loads(stdout)
+        test_results = [r for r in output["results"] if r.get("check") == "tests"]
+        self.assertEqual(test_results[0]["status"], "INFO")
+
+    def test_cli_stream_emits_json_lines(self):
+        """--stream prints one result per line and a final summary line."""
+        tmpdir = self.tmpdir
+        self._create_track(tmpdir, "03_api", wave=2)
+
+        returncode, stdout = self._run_cli("--wave", "2", "--tracks-dir", tmpdir, "--skip-tests", "--stream")
+        self.assertEqual(returncode, 0)
+        lines = [json.loads(line) for line in stdout.splitlines()]
+        self.assertTrue(lines[-1]["_final"])
+        self.assertTrue(lines[-1]["passed"])
+        self.assertEqual(lines[-1]["summary"]["pass"], 1)
+        self.assertIn("PASS", [r["status"] for r in lines[:-1]])
 
     def test_cli_quality_threshold_advisory(self):
         """Quality threshold appears as INFO, never FAIL."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            self._create_track(tmpdir, "03_api", wave=2,
-                               quality={"line_coverage": 80, "pass_rate": 100})
-
-            result = subprocess.run(
-                [sys.executable, str(REPO_ROOT / "scripts" / "validate_wave_completion.py"),
-                 "--wave", "2", "--tracks-dir", tmpdir, "--skip-tests"],
-                capture_output=True, text=True,
-            )
-            output = json.loads(result.stdout)
-            # Quality check should be INFO, not FAIL
-            quality_results = [r for r in output["results"] if r.get("check") == "quality"]
-            for r in quality_results:
-                self.assertNotEqual(r["status"], "FAIL")
+        tmpdir = self.tmpdir
+        self._create_track(tmpdir, "03_api", wave=2,
+                           quality={"line_coverage": 80, "pass_rate": 100})
+
+        _, stdout = self._run_cli("--wave", "2", "--tracks-dir", tmpdir, "--skip-tests")
+        output = json.loads(stdout)
+        # Quality check should be INFO, not FAIL
+        quality_results = [r for r in output["results"] if r.get("check") == "quality"]
+        for r in quality_results:
+            self.assertNotEqual(r["status"], "FAIL")
+
+    def _run_test_command(self, command):
+        """Validate one track with the given test_command.
+
+        Returns the tests check message and the shell flag of each spawn.
+        """
+        track_dir = self._create_track(self.tmpdir, "01_suite", wave=1)
+        meta_path = track_dir / "metadata.json"
+        meta = _load_json(meta_path)
+        meta["test_command"] = command
+        meta_path.write_text(json.dumps(meta))
+
+        with mock.patch.object(vwc, "_spawn", wraps=vwc._spawn) as spawn:
+            returncode, stdout = self._run_cli("--wave", "1", "--tracks-dir", self.tmpdir)
+        self.assertEqual(returncode, 1)
+        output = json.loads(stdout)
+        test_results = [r for r in output["results"] if r.get("check") == "tests"]
+        self.assertEqual(test_results[0]["status"], "FAIL")
+        return test_results[0]["message"], [c.kwargs["shell"] for c in spawn.call_args_list]
+
+    def _suite_script(self, body):
+        """Write a Python test suite stand-in; return the command running it."""
+        script = Path(self.tmpdir) / "suite.py"
+        script.write_text(body)
+        return f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}"
+
+    def test_cli_plain_command_runs_without_shell(self):
+        """A command with no shell syntax is executed directly."""
+        command = self._suite_script('import sys\nprint("3 failed")\nsys.exit(3)\n')
+
+        message, shells = self._run_test_command(command)
+        self.assertEqual(shells, [False])
+        self.assertEqual(message, "Tests failing (exit 3): 3 failed")
+
+    def test_cli_shell_only_commands_fall_back_to_shell(self):
+        """Builtins and VAR=value prefixes are not programs; the shell runs them."""
+        suite = self._suite_script(
+            'import os, sys\nsys.exit(int(os.environ["SUITE_EXIT"]))\n'
+        )
+        for command, code in (("exit 4", 4), (f"SUITE_EXIT=5 {suite}", 5)):
+            with self.subTest(command=command):
+                message, shells = self._run_test_command(command)
+                self.assertEqual(shells, [False, True])
+                self.assertTrue(message.startswith(f"Tests failing (exit {code})"), message)
+
+    def test_cli_missing_command_reports_shell_failure(self):
+        """An unknown program fails the way /bin/sh reports it: exit 127."""
+        message, shells = self._run_test_command("no-such-test-runner --verbose")
+        self.assertEqual(shells, [False, True])
+        self.assertTrue(message.startswith("Tests failing (exit 127)"), message)
+        self.assertIn("not found", message)
+
+    def test_cli_long_output_reports_last_lines(self):
+        """Only the tail of a chatty failing suite is kept and reported."""
+        command = self._suite_script(
+            "import sys\nfor i in range(50):\n    print(f'line {i}')\nsys.exit(2)\n"
+        )
+
+        message, _ = self._run_test_command(command)
+        tail = "\n".join(f"line {i}" for i in range(45, 50))
+        self.assertEqual(message, f"Tests failing (exit 2): {tail}")
+
+    def test_collect_tail_marks_dropped_lines(self):
+        """Lines dropped ahead of the kept tail leave a truncation marker."""
+        sink = []
+        vwc._collect_tail(io.StringIO("".join(f"line {i}\n" for i in range(50))), sink)
+        tail = "".join(f"line {i}\n" for i in range(50 - vwc.OUTPUT_TAIL_LINES, 50))
+        self.assertEqual(sink, ["...\n" + tail])
+
+        # Nothing dropped, no marker
+        sink = []
+        vwc._collect_tail(io.StringIO("line 0\nline 1\n"), sink)
+        self.assertEqual(sink, ["line 0\nline 1\n"])
+
+    @unittest.skipUnless(hasattr(os, "killpg"), "needs POSIX process groups")
+    def test_cli_interrupt_kills_running_tests(self):
+        """Ctrl-C ends the run promptly and kills the running test command."""
+        tmpdir = self.tmpdir
+        pid_file = Path(tmpdir) / "tests.pid"
+        track_dir = self._create_track(tmpdir, "01_slow", wave=1)
+        meta_path = track_dir / "metadata.json"
+        meta = _load_json(meta_path)
+        # The shell records its PID, then becomes the long-running suite
+        meta["test_command"] = f"echo $$ > {shlex.quote(str(pid_file))}; exec sleep 60"
+        meta_path.write_text(json.dumps(meta))
+
+        # A real process: the signal has to arrive while main() waits
+        proc = subprocess.Popen(
+            [sys.executable, str(REPO_ROOT / "scripts" / "validate_wave_completion.py"),
+             "--wave", "1", "--tracks-dir", tmpdir],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 10
+            while not (pid_file.exists() and pid_file.read_text().strip()):
+                self.assertLess(time.monotonic(), deadline, "test command never started")
+                time.sleep(0.05)
+            test_pid = int(pid_file.read_text())
+
+            proc.send_signal(signal.SIGINT)
+            proc.wait(timeout=5)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+        self.assertNotEqual(proc.returncode, 0)
+        # Killed, not left running in its own session
+        with self.assertRaises(ProcessLookupError):
+            os.kill(test_pid, 0)
 
 
 # --- SKILL.md Documentation ---
@@ -385,9 +565,10 @@ class TestWaveValidationIntegration(unittest.TestCase):
 class TestSkillDocumentation(unittest.TestCase):
     """Verify SKILL.md documents T-TEST features."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         skill_path = REPO_ROOT / "skills" / "architect" / "SKILL.md"
-        self.content = skill_path.read_text()
+        cls.content = skill_path.read_text()
 
     def test_has_enhanced_testing_section(self):
         self.assertIn("Enhanced Testing Integration", self.content)
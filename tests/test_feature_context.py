@@ -14,8 +14,10 @@ from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT / "scripts"))
+sys.path.insert(0, str(REPO_ROOT / "tests"))
 
 import feature_context as fc
+from _integration_helpers import run_main
 
 SCRIPT_PATH = REPO_ROOT / "scripts" / "feature_context.py"
 
@@ -88,13 +90,16 @@ class TestExtractKeywords(unittest.TestCase):
 
 
 class TestExtractArchitectureSummary(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The sample text is constant; parse it once for the read-only checks
+        cls.summary = fc.extract_architecture_summary(SAMPLE_ARCH_TEXT, 6000)
+
     def test_extracts_components(self):
-        summary = fc.extract_architecture_summary(SAMPLE_ARCH_TEXT, 6000)
-        self.assertIsInstance(summary["components"], list)
+        self.assertIsInstance(self.summary["components"], list)
 
     def test_returns_excerpt(self):
-        summary = fc.extract_architecture_summary(SAMPLE_ARCH_TEXT, 6000)
-        self.assertIn("System Architecture", summary["excerpt"])
+        self.assertIn("System Architecture", self.summary["excerpt"])
 
     def test_none_input(self):
         summary = fc.extract_architecture_summary(None, 6000)
@@ -108,28 +113,32 @@ class TestExtractArchitectureSummary(unittest.TestCase):
 
 
 class TestExtractActiveConstraints(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.constraints = fc.extract_active_constraints(SAMPLE_CC_TEXT, 2000)
+
     def test_extracts_constraints(self):
-        constraints = fc.extract_active_constraints(SAMPLE_CC_TEXT, 2000)
-        self.assertGreater(len(constraints), 0)
+        self.assertGreater(len(self.constraints), 0)
 
     def test_includes_version(self):
-        constraints = fc.extract_active_constraints(SAMPLE_CC_TEXT, 2000)
-        self.assertTrue(any("CC v1.0" in c for c in constraints))
+        self.assertTrue(any("CC v1.0" in c for c in self.constraints))
 
     def test_none_input(self):
         self.assertEqual(fc.extract_active_constraints(None, 2000), [])
 
 
 class TestExtractDependencyGraph(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.graph = fc.extract_dependency_graph(SAMPLE_DEP_TEXT, 2000)
+
     def test_extracts_nodes(self):
-        graph = fc.extract_dependency_graph(SAMPLE_DEP_TEXT, 2000)
-        self.assertIn("01_infra", graph["nodes"])
-        self.assertIn("02_auth", graph["nodes"])
-        self.assertIn("03_api", graph["nodes"])
+        self.assertIn("01_infra", self.graph["nodes"])
+        self.assertIn("02_auth", self.graph["nodes"])
+        self.assertIn("03_api", self.graph["nodes"])
 
     def test_extracts_edges(self):
-        graph = fc.extract_dependency_graph(SAMPLE_DEP_TEXT, 2000)
-        self.assertIn(["01_infra", "02_auth"], graph["edges"])
+        self.assertIn(["01_infra", "02_auth"], self.graph["edges"])
 
     def test_none_input(self):
         graph = fc.extract_dependency_graph(None, 2000)
@@ -148,9 +157,13 @@ class TestTruncate(unittest.TestCase):
 
 
 class TestIntegration(unittest.TestCase):
-    """Integration tests that run the script as a subprocess."""
+    """Integration tests that run the script's main() end to end."""
 
     def _run_script(self, args: list[str]) -> subprocess.CompletedProcess:
+        return run_main(fc.main, args)
+
+    def _run_subprocess(self, args: list[str]) -> subprocess.CompletedProcess:
+        """Run the script as a separate process, as the CLI is invoked."""
         return subprocess.run(
             [sys.executable, str(SCRIPT_PATH), *args],
             capture_output=True,
@@ -159,7 +172,7 @@ class TestIntegration(unittest.TestCase):
 
     def test_with_sample_project(self):
         """Run against the real sample project."""
-        result = self._run_script([
+        result = self._run_subprocess([
             "--feature-description", "Add role-based access control",
             "--conductor-dir", str(SAMPLE_CONDUCTOR_DIR),
             "--architect-dir", str(SAMPLE_ARCHITECT_DIR),
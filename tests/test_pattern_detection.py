@@ -17,8 +17,10 @@ from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT / "scripts"))
+sys.path.insert(0, str(REPO_ROOT / "tests"))
 
 import detect_patterns as dp
+from _integration_helpers import run_main
 
 # --- Sample data ---
 
@@ -171,8 +173,13 @@ class TestAlreadyTracked(unittest.TestCase):
 
 
 class TestDetectPatterns(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # SAMPLE_ANALYSIS is constant; analyse it once for the read-only checks
+        cls.sample_result = dp.detect_patterns(SAMPLE_ANALYSIS)
+
     def test_full_analysis(self):
-        result = dp.detect_patterns(SAMPLE_ANALYSIS)
+        result = self.sample_result
         self.assertGreater(result["summary"]["total_patterns"], 0)
         self.assertGreater(result["summary"]["cross_cutting_candidates"], 0)
 
@@ -184,14 +191,12 @@ class TestDetectPatterns(unittest.TestCase):
         self.assertEqual(result["summary"]["total_patterns"], 0)
 
     def test_project_characteristics(self):
-        result = dp.detect_patterns(SAMPLE_ANALYSIS)
-        chars = result["project_characteristics"]
+        chars = self.sample_result["project_characteristics"]
         self.assertEqual(chars["total_modules"], 3)
 
     def test_recommendations_present(self):
-        result = dp.detect_patterns(SAMPLE_ANALYSIS)
         patterns_with_recs = [
-            p for p in result["patterns_detected"]
+            p for p in self.sample_result["patterns_detected"]
             if "recommendation" in p
         ]
         self.assertGreater(len(patterns_with_recs), 0)
@@ -214,11 +219,8 @@ class TestIntegration(unittest.TestCase):
             json.dump(SAMPLE_ANALYSIS, f)
             f.flush()
 
-            result = subprocess.run(
-                [sys.executable, str(REPO_ROOT / "scripts" / "detect_patterns.py"),
-                 "--analysis-file", f.name],
-                capture_output=True, text=True,
-            )
+            # In-process: the stdin test above already covers the CLI
+            result = run_main(dp.main, ["--analysis-file", f.name])
             self.assertEqual(result.returncode, 0, f"stderr: {result.stderr}")
             data = json.loads(result.stdout)
             self.assertIn("patterns_detected", data)
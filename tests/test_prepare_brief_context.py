@@ -17,8 +17,10 @@ from pathlib import Path
 # Add scripts/ to path so we can import the module under test
 REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT / "scripts"))
+sys.path.insert(0, str(REPO_ROOT / "tests"))
 
 import prepare_brief_context as pbc
+from _integration_helpers import run_main
 
 # Path to sample project fixtures
 SAMPLE_PROJECT = REPO_ROOT / "examples" / "sample-project"
@@ -236,9 +238,13 @@ class TestBuildMetadataFromArgs(unittest.TestCase):
 
 
 class TestIntegration(unittest.TestCase):
-    """Integration tests that run the script as a subprocess."""
+    """Integration tests that run the script's main() end to end."""
 
     def _run_script(self, args: list[str]) -> subprocess.CompletedProcess:
+        return run_main(pbc.main, args)
+
+    def _run_subprocess(self, args: list[str]) -> subprocess.CompletedProcess:
+        """Run the script as a separate process, as the CLI is invoked."""
         return subprocess.run(
             [sys.executable, str(SCRIPT_PATH), *args],
             capture_output=True,
@@ -247,7 +253,7 @@ class TestIntegration(unittest.TestCase):
 
     def test_with_sample_project(self):
         """Run against the real sample project fixtures."""
-        result = self._run_script([
+        result = self._run_subprocess([
             "--track", "01_infra_scaffold",
             "--tracks-dir", str(SAMPLE_TRACKS_DIR),
             "--architect-dir", str(SAMPLE_ARCHITECT_DIR),
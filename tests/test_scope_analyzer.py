@@ -13,8 +13,10 @@ from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT / "scripts"))
+sys.path.insert(0, str(REPO_ROOT / "tests"))
 
 import scope_analyzer as sa
+from _integration_helpers import run_main
 
 SCRIPT_PATH = REPO_ROOT / "scripts" / "scope_analyzer.py"
 
@@ -45,6 +47,16 @@ SAMPLE_ARCH_STATE = {
     "architecture_components": ["api-gateway", "frontend-app", "postgres-db"],
 }
 
+# Stdin payloads for the integration tests, serialized once at import
+RBAC_STDIN = json.dumps({
+    "feature_description": "Add role-based access control with table and endpoint",
+    "architecture_state": SAMPLE_ARCH_STATE,
+})
+OPTIMIZE_STDIN = json.dumps({
+    "feature_description": "optimize",
+    "architecture_state": SAMPLE_ARCH_STATE,
+})
+
 
 class TestDetectAmbiguity(unittest.TestCase):
     def test_vague_description(self):
@@ -256,9 +268,12 @@ class TestEstimateComplexity(unittest.TestCase):
 
 
 class TestIntegration(unittest.TestCase):
-    """Integration tests that run the script as a subprocess."""
+    """Integration tests that run the script's main() entry point."""
 
     def _run_script(self, args: list[str], stdin: str = "") -> subprocess.CompletedProcess:
+        return run_main(sa.main, args, stdin)
+
+    def _run_subprocess(self, args: list[str], stdin: str = "") -> subprocess.CompletedProcess:
         return subprocess.run(
             [sys.executable, str(SCRIPT_PATH), *args],
             capture_output=True,
@@ -275,21 +290,14 @@ class TestIntegration(unittest.TestCase):
         self.assertIn("recommendation", data)
 
     def test_stdin_json(self):
-        input_data = json.dumps({
-            "feature_description": "Add role-based access control with table and endpoint",
-            "architecture_state": SAMPLE_ARCH_STATE,
-        })
-        result = self._run_script([], stdin=input_data)
+        # Real subprocess: keeps the shebang/__main__ path covered
+        result = self._run_subprocess([], stdin=RBAC_STDIN)
         self.assertEqual(result.returncode, 0, f"stderr: {result.stderr}")
         data = json.loads(result.stdout)
         self.assertIn("recommendation", data)
 
     def test_needs_clarification_exit_code(self):
-        input_data = json.dumps({
-            "feature_description": "optimize",
-            "architecture_state": SAMPLE_ARCH_STATE,
-        })
-        result = self._run_script([], stdin=input_data)
+        result = self._run_script([], stdin=OPTIMIZE_STDIN)
         self.assertEqual(result.returncode, 2)
 
 
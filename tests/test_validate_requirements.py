@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Tests for scripts/validate_requirements.py fuzzy matching.
+
+Pins the bounded SequenceMatcher check and fuzzy_match verdicts against
+plain SequenceMatcher.ratio(), so the fast paths cannot change results.
+
+Uses unittest (stdlib-only). Run with:
+    python -m unittest tests/test_validate_requirements.py -v
+"""
+
+import random
+import sys
+import unittest
+from difflib import SequenceMatcher
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import validate_requirements as vr
+
+# --- Sample data ---
+
+SAMPLE_REQUIREMENTS = [
+    "Users must authenticate with email and password",
+    "Sessions expire after 30 minutes of inactivity",
+    "The API shall respond within 200ms at p95",
+    "Passwords must be hashed with bcrypt",
+    "Support at least 1000 concurrent users",
+    "Admins can configure the rate limit per tenant",
+    "Failed logins are logged to the audit trail",
+    "Tokens rotate every 24 hours",
+    "Reject uploads larger than 10 MB",
+    "Retry failed webhooks with exponential backoff",
+]
+
+
+# Fractions of a requirement's length to edit: from light rewording to
+# barely recognisable, so the SequenceMatcher ratios straddle 0.55
+EDIT_FRACTIONS = (0.15, 0.3, 0.45, 0.6, 0.75)
+
+
+def _mutate(text: str, edits: int, rng: random.Random) -> str:
+    """Apply random character substitutions, deletions and insertions."""
+    chars = list(text)
+    for _ in range(edits):
+        op = rng.random()
+        i = rng.randrange(len(chars))
+        if op < 0.4:
+            chars[i] = rng.choice("abcdefghijklmnopqrstuvwxyz ")
+        elif op < 0.7 and len(chars) > 1:
+            del chars[i]
+        else:
+            chars.insert(i, rng.choice("abcdefghijklmnopqrstuvwxyz "))
+    return "".join(chars)
+
+
+def _sample_pairs() -> list[tuple[str, str]]:
+    """Each requirement against its own mutations (near the thresholds) and
+    against the other requirements (mostly far below them)."""
+    rng = random.Random(20240601)
+    pairs = [(a, b) for a in SAMPLE_REQUIREMENTS for b in SAMPLE_REQUIREMENTS if a != b]
+    for text in SAMPLE_REQUIREMENTS:
+        variants = [text] + [
+            _mutate(text, max(1, int(len(text) * f)), rng) for f in EDIT_FRACTIONS
+        ]
+        pairs += [(a, b) for a in variants for b in variants if a != b]
+    return pairs
+
+
+def _reference_fuzzy_match(requirement: str, candidate: str, threshold: float = 0.45) -> bool:
+    """fuzzy_match as a plain any-strategy check, with no prefilters or caches."""
+    req_lower = requirement.lower().strip()
+    cand_lower = candidate.lower().strip()
+    if req_lower in cand_lower or cand_lower in req_lower:
+        return True
+
+    req_numbers = vr.extract_numbers(requirement)
+    cand_numbers = vr.extract_numbers(candidate)
+    if req_numbers and cand_numbers and not req_numbers & cand_numbers:
+        return False
+
+    req_ngrams, req_mag = vr.char_ngrams(req_lower)
+    cand_ngrams, cand_mag = vr.char_ngrams(cand_lower)
+    return (
+        SequenceMatcher(None, req_lower, cand_lower).ratio() >= 0.55
+        or vr.jaccard_similarity(
+            frozenset(vr.tokenize(requirement)), frozenset(vr.tokenize(candidate))
+        ) >= threshold
+        or vr.jaccard_similarity(
+            frozenset(vr.tokenize(requirement, stem=True)),
+            frozenset(vr.tokenize(candidate, stem=True)),
+        ) >= threshold - 0.05
+        or vr.cosine_similarity_ngrams(req_ngrams, req_mag, cand_ngrams, cand_mag) >= 0.5
+    )
+
+
+class TestSeqRatioAtLeast(unittest.TestCase):
+    def test_matches_plain_ratio_at_the_threshold(self):
+        for a, b in _sample_pairs():
+            exact = SequenceMatcher(None, a, b).ratio()
+            # The exact ratio itself and its neighbours probe the boundary
+            for threshold in (exact, exact - 1e-9, exact + 1e-9, 0.55):
+                self.assertEqual(
+                    vr._seq_ratio_at_least(SequenceMatcher(None, a, b), threshold),
+                    exact >= threshold,
+                    f"{a!r} vs {b!r} at {threshold}",
+                )
+
+    def test_exact_boundary(self):
+        # 11 shared characters out of 40: ratio is exactly 0.55
+        a = "abcdefghijk" + "LMNOPQRST"
+        b = "abcdefghijk" + "uvwxyz012"
+        self.assertEqual(SequenceMatcher(None, a, b).ratio(), 0.55)
+        self.assertTrue(vr._seq_ratio_at_least(SequenceMatcher(None, a, b), 0.55))
+        self.assertFalse(vr._seq_ratio_at_least(SequenceMatcher(None, a, b), 0.56))
+
+    def test_reused_candidate_matcher(self):
+        # The cached per-candidate matcher only swaps seq1 between calls
+        for a, b in _sample_pairs():
+            matcher = vr._candidate_matcher(b)
+            matcher.set_seq1(a)
+            self.assertEqual(
+                vr._seq_ratio_at_least(matcher, 0.55),
+                SequenceMatcher(None, a, b).ratio() >= 0.55,
+                f"{a!r} vs {b!r}",
+            )
+
+
+class TestFuzzyMatch(unittest.TestCase):
+    def test_substring_matches(self):
+        self.assertTrue(vr.fuzzy_match("hashed with bcrypt", SAMPLE_REQUIREMENTS[3]))
+
+    def test_numeric_disagreement_vetoes(self):
+        self.assertFalse(vr.fuzzy_match(
+            "Sessions expire after 30 minutes of inactivity",
+            "Sessions expire after 5 minutes of inactivity",
+        ))
+
+    def test_matches_reference(self):
+        for a, b in _sample_pairs():
+            for threshold in (0.45, 0.35):
+                self.assertEqual(
+                    vr.fuzzy_match(a, b, threshold=threshold),
+                    _reference_fuzzy_match(a, b, threshold=threshold),
+                    f"{a!r} vs {b!r} at {threshold}",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,45 +73,65 @@ SAMPLE_ARCHITECTURE = textwrap.dedent("""\
 """)
 
 
+# --- Shared fixtures ---
+
+# Written and parsed once for the module; the parser tests only read them
+_fixture_tmp: tempfile.TemporaryDirectory | None = None
+_empty_tmp: tempfile.TemporaryDirectory | None = None
+_PARSED_GRAPH: dict = {}
+_PARSED_WAVES: list = []
+_PARSED_COMPONENTS: list = []
+
+
+def setUpModule():
+    global _fixture_tmp, _empty_tmp
+    global _PARSED_GRAPH, _PARSED_WAVES, _PARSED_COMPONENTS
+    _fixture_tmp = tempfile.TemporaryDirectory()
+    _empty_tmp = tempfile.TemporaryDirectory()
+    fixture_dir = Path(_fixture_tmp.name)
+    (fixture_dir / "dependency-graph.md").write_text(SAMPLE_DEP_GRAPH)
+    (fixture_dir / "execution-sequence.md").write_text(SAMPLE_EXEC_SEQ)
+    (fixture_dir / "architecture.md").write_text(SAMPLE_ARCHITECTURE)
+    _PARSED_GRAPH = gd.parse_dependency_graph(_fixture_tmp.name)
+    _PARSED_WAVES = gd.parse_execution_sequence(_fixture_tmp.name)
+    _PARSED_COMPONENTS = gd.parse_architecture_components(_fixture_tmp.name)
+
+
+def tearDownModule():
+    _fixture_tmp.cleanup()
+    _empty_tmp.cleanup()
+
+
 class TestParseDependencyGraph(unittest.TestCase):
     def test_parses_table(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            (Path(tmpdir) / "dependency-graph.md").write_text(SAMPLE_DEP_GRAPH)
-            graph = gd.parse_dependency_graph(tmpdir)
-            self.assertIn("01_infra", graph)
-            self.assertIn("02_db", graph)
-            self.assertEqual(graph["01_infra"], [])
-            self.assertEqual(graph["02_db"], ["01_infra"])
-            self.assertIn("01_infra", graph["03_auth"])
-            self.assertIn("02_db", graph["03_auth"])
+        graph = _PARSED_GRAPH
+        self.assertIn("01_infra", graph)
+        self.assertIn("02_db", graph)
+        self.assertEqual(graph["01_infra"], [])
+        self.assertEqual(graph["02_db"], ["01_infra"])
+        self.assertIn("01_infra", graph["03_auth"])
+        self.assertIn("02_db", graph["03_auth"])
 
     def test_missing_file(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            self.assertEqual(gd.parse_dependency_graph(tmpdir), {})
+        self.assertEqual(gd.parse_dependency_graph(_empty_tmp.name), {})
 
 
 class TestParseExecutionSequence(unittest.TestCase):
     def test_parses_waves(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            (Path(tmpdir) / "execution-sequence.md").write_text(SAMPLE_EXEC_SEQ)
-            waves = gd.parse_execution_sequence(tmpdir)
-            self.assertEqual(len(waves), 3)
-            self.assertEqual(waves[0]["number"], 1)
-            self.assertIn("01_infra", waves[0]["tracks"])
+        waves = _PARSED_WAVES
+        self.assertEqual(len(waves), 3)
+        self.assertEqual(waves[0]["number"], 1)
+        self.assertIn("01_infra", waves[0]["tracks"])
 
     def test_missing_file(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            self.assertEqual(gd.parse_execution_sequence(tmpdir), [])
+        self.assertEqual(gd.parse_execution_sequence(_empty_tmp.name), [])
 
 
 class TestParseArchitectureComponents(unittest.TestCase):
     def test_parses_table(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            (Path(tmpdir) / "architecture.md").write_text(SAMPLE_ARCHITECTURE)
-            components = gd.parse_architecture_components(tmpdir)
-            names = [c["name"] for c in components]
-            self.assertIn("API Gateway", names)
-            self.assertIn("Auth Service", names)
+        names = [c["name"] for c in _PARSED_COMPONENTS]
+        self.assertIn("API Gateway", names)
+        self.assertIn("Auth Service", names)
 
 
 class TestGenerateDependencyGraph(unittest.TestCase):
@@ -168,44 +188,42 @@ class TestGenerateWaveTimeline(unittest.TestCase):
 
 
 class TestGenerateDiagramsIntegration(unittest.TestCase):
-    def test_dry_run(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            arch_dir = Path(tmpdir) / "architect"
-            arch_dir.mkdir()
-            (arch_dir / "dependency-graph.md").write_text(SAMPLE_DEP_GRAPH)
-            (arch_dir / "execution-sequence.md").write_text(SAMPLE_EXEC_SEQ)
-            (arch_dir / "architecture.md").write_text(SAMPLE_ARCHITECTURE)
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.root = Path(cls._tmp.name)
+        cls.arch_dir = cls.root / "architect"
+        cls.arch_dir.mkdir()
+        (cls.arch_dir / "dependency-graph.md").write_text(SAMPLE_DEP_GRAPH)
+        (cls.arch_dir / "execution-sequence.md").write_text(SAMPLE_EXEC_SEQ)
+        (cls.arch_dir / "architecture.md").write_text(SAMPLE_ARCHITECTURE)
+
+        cls.tracks_dir = cls.root / "conductor" / "tracks"
+        cls.tracks_dir.mkdir(parents=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def _output_dir(self) -> Path:
+        return self.root / f"{self._testMethodName}_diagrams"
 
-            tracks_dir = Path(tmpdir) / "conductor" / "tracks"
-            tracks_dir.mkdir(parents=True)
-
-            output_dir = Path(tmpdir) / "diagrams"
-
-            result = gd.generate_diagrams(
-                str(tracks_dir), str(arch_dir), str(output_dir), dry_run=True
-            )
-            self.assertGreater(len(result["diagrams_generated"]), 0)
-            self.assertFalse(output_dir.exists())
+    def test_dry_run(self):
+        output_dir = self._output_dir()
+        result = gd.generate_diagrams(
+            str(self.tracks_dir), str(self.arch_dir), str(output_dir), dry_run=True
+        )
+        self.assertGreater(len(result["diagrams_generated"]), 0)
+        self.assertFalse(output_dir.exists())
 
     def test_writes_files(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            arch_dir = Path(tmpdir) / "architect"
-            arch_dir.mkdir()
-            (arch_dir / "dependency-graph.md").write_text(SAMPLE_DEP_GRAPH)
-            (arch_dir / "execution-sequence.md").write_text(SAMPLE_EXEC_SEQ)
-            (arch_dir / "architecture.md").write_text(SAMPLE_ARCHITECTURE)
-
-            tracks_dir = Path(tmpdir) / "conductor" / "tracks"
-            tracks_dir.mkdir(parents=True)
-
-            output_dir = Path(tmpdir) / "diagrams"
-
-            gd.generate_diagrams(
-                str(tracks_dir), str(arch_dir), str(output_dir)
-            )
-            self.assertTrue(output_dir.exists())
-            self.assertTrue((output_dir / "dependency-graph.mmd").exists())
-            self.assertTrue((output_dir / "wave-timeline.mmd").exists())
+        output_dir = self._output_dir()
+        gd.generate_diagrams(
+            str(self.tracks_dir), str(self.arch_dir), str(output_dir)
+        )
+        self.assertTrue(output_dir.exists())
+        self.assertTrue((output_dir / "dependency-graph.mmd").exists())
+        self.assertTrue((output_dir / "wave-timeline.mmd").exists())
 
     def test_sample_project(self):
         """Run against the real sample project."""